@@ -6,25 +6,172 @@ Generates plots for population dynamics, species diversity, and reaction statist
 Supports the Metabolic Model with age deaths and cosmic ray spawns.
 """
 
+import os
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Pick the headless backend before pyplot is imported: batch runs with
+# --no-show (and CI boxes without a display) otherwise pay several hundred
+# ms of GUI backend initialization for nothing.
+if '--no-show' in sys.argv or not os.environ.get('DISPLAY'):
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+    except ImportError:
+        pass  # the import block below reports the missing package
+
 try:
     import matplotlib.pyplot as plt
     import matplotlib.ticker as ticker
+    from matplotlib.collections import LineCollection
+    from matplotlib.lines import Line2D
     import pandas as pd
     import numpy as np
+    from scipy.ndimage import uniform_filter1d
 except ImportError as e:
     print(f"Error: Missing required package: {e}")
-    print("Install with: pip install matplotlib pandas numpy")
+    print("Install with: pip install matplotlib pandas numpy scipy")
     sys.exit(1)
 
+# Above this many log rows, grouped panels are drawn as a single LineCollection
+# instead of one Line2D per series (much faster for 100k+ step logs).
+LINE_COLLECTION_MIN_ROWS = 5000
+
+# Shared x-axis tick formatter ("12k" above 1000 steps). One instance serves
+# every axis instead of allocating a fresh FuncFormatter closure per panel,
+# and matplotlib can cache formatter state across axes.
+STEP_FORMATTER = ticker.FuncFormatter(
+    lambda x, _: f'{x/1000:.0f}k' if x >= 1000 else f'{x:.0f}')
+
+# Pillow PNG encode settings for savefig. zlib level 1 writes ~3x faster
+# than the default level 6 for a modestly larger file; these plots go to
+# local disk where the encode, not the write, is the bottleneck.
+PNG_KWARGS = {'compress_level': 1, 'optimize': False}
+
+# Target point count per plotted series. A ~1920-px figure can only resolve
+# ~2000 distinct x-positions, so feeding matplotlib more than this is pure
+# path-simplifier overhead on million-step logs.
+DOWNSAMPLE_POINTS = 4000
+
+
+def format_step_axis(ax, x) -> None:
+    """Pick the step-axis scale/formatter for a log spanning max(x) steps.
+
+    Short logs keep the shared k-suffix FuncFormatter. Past ~100k steps the
+    axis switches to symlog with matplotlib's native LogFormatterSciNotation,
+    which keeps the Python lambda out of the tick re-layout path entirely.
+    """
+    if len(x) and x.max() > 1e5:
+        ax.set_xscale('symlog')
+        ax.xaxis.set_major_formatter(ticker.LogFormatterSciNotation())
+    else:
+        ax.xaxis.set_major_formatter(STEP_FORMATTER)
+
+
+def decimate(x, y, n_out: int = DOWNSAMPLE_POINTS):
+    """
+    Min/max-bucket downsample a series for plotting.
+
+    Splits the series into n_out/2 buckets and keeps each bucket's minimum and
+    maximum sample (in x-order), so peaks and troughs survive the reduction.
+    Series at or below n_out points are returned unchanged.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(x)
+    if n <= n_out:
+        return x, y
+
+    n_buckets = max(n_out // 2, 1)
+    m = n // n_buckets
+    offsets = np.arange(n_buckets) * m
+    buckets = y[:n_buckets * m].reshape(n_buckets, m)
+    idx = np.union1d(offsets + buckets.argmin(axis=1),
+                     offsets + buckets.argmax(axis=1))
+    # Always keep the endpoints so the plotted range is exact
+    idx = np.union1d(idx, [0, n - 1])
+    return x[idx], y[idx]
+
+
+def smoothed_rate(values: np.ndarray, window: int = 10) -> np.ndarray:
+    """
+    Per-step rate of a cumulative counter, box-smoothed over `window` samples.
+
+    Approximates the old diff().fillna(0).rolling(window, min_periods=1)
+    .mean() pandas chain with one diff plus one C convolution kernel. The
+    filter origin anchors the box at the current sample like the trailing
+    rolling window did; only the first window-1 samples differ, where
+    rolling shrank its window and the kernel repeats the edge value.
+    """
+    rates = np.diff(values, prepend=values[:1]).astype(np.float64)
+    return uniform_filter1d(rates, size=window, mode='nearest',
+                            origin=(window - 1) // 2)
+
 
-def load_log(filepath: Path) -> pd.DataFrame:
-    """Load and validate a grid simulation log CSV."""
+def plot_series_group(ax, x, series: list, linewidth: float = 1.5) -> list:
+    """
+    Draw multiple series sharing one x-axis on a single Axes.
+
+    series is a list of (label, ydata, color, linestyle) tuples. For long logs
+    all lines are batched into one LineCollection (one draw call instead of one
+    per series); legend handles are returned as proxy artists in that case.
+    """
+    if len(x) > LINE_COLLECTION_MIN_ROWS and len(series) > 1:
+        segs = [np.column_stack(decimate(x, y)) for _, y, _, _ in series]
+        ax.add_collection(LineCollection(
+            segs,
+            colors=[c for _, _, c, _ in series],
+            linestyles=[ls for _, _, _, ls in series],
+            linewidths=linewidth
+        ))
+        ax.autoscale_view()
+        return [Line2D([], [], color=c, linestyle=ls, label=lab)
+                for lab, _, c, ls in series]
+
+    handles = []
+    for label, y, color, linestyle in series:
+        xs, ys = decimate(x, y)
+        handles.extend(ax.plot(xs, ys, color=color, linewidth=linewidth,
+                               linestyle=linestyle, label=label))
+    return handles
+
+
+# Columns the plots actually consume; anything else in a wide log
+# (e.g. per-species columns) is skipped at parse time.
+PLOT_COLUMNS = {
+    'step', 'population', 'unique_species',
+    'reactions_success', 'reactions_diverged',
+    'attacks', 'evasions', 'movements',
+    'deaths_age', 'cosmic_spawns',
+}
+
+_COLUMN_DTYPES = {c: 'int32' for c in PLOT_COLUMNS}
+
+
+def load_log(filepath: Path) -> tuple:
+    """
+    Load and validate a grid simulation log CSV.
+
+    Returns (df, features) where features is the frozenset of available plot
+    columns, so callers branch on one precomputed set instead of repeated
+    `in df.columns` probes.
+    """
     try:
-        df = pd.read_csv(filepath)
+        # Peek the header first so the parser never tokenizes columns the
+        # plots don't use, and allocates tight int32 columns for the rest.
+        header = pd.read_csv(filepath, nrows=0).columns
+        usecols = [c for c in header if c in PLOT_COLUMNS]
+        read_kwargs = dict(usecols=usecols,
+                           dtype={c: _COLUMN_DTYPES[c] for c in usecols})
+        try:
+            # Arrow's CSV reader tokenizes with multiple threads; for
+            # multi-million-row logs the parse dominates load time.
+            df = pd.read_csv(filepath, engine='pyarrow', **read_kwargs)
+        except (ImportError, ValueError):
+            # pyarrow is optional; fall back to the single-threaded C engine
+            df = pd.read_csv(filepath, **read_kwargs)
     except Exception as e:
         print(f"Error loading {filepath}: {e}")
         sys.exit(1)
@@ -35,20 +182,58 @@ def load_log(filepath: Path) -> pd.DataFrame:
         print(f"Error: Missing columns in log file: {missing}")
         print(f"Found columns: {list(df.columns)}")
         sys.exit(1)
-    
-    return df
+
+    # Bail out before any figure is built: a header-only log would otherwise
+    # pay full figure construction and savefig cost to render empty panels.
+    if len(df) == 0:
+        print(f"Error: Log file has no data rows: {filepath}")
+        sys.exit(0)
+
+    # Downcast anything the parser still left at 64-bit (e.g. the pyarrow
+    # engine ignores the dtype map): plotting needs nowhere near 64 bits of
+    # precision and halving the element size halves bytes moved downstream.
+    downcast = {c: 'int32' for c in df.select_dtypes('int64').columns}
+    downcast.update({c: 'float32' for c in df.select_dtypes('float64').columns})
+    if downcast:
+        df = df.astype(downcast)
+
+    return df, frozenset(df.columns)
 
 
-def plot_detailed(df: pd.DataFrame, output_path: Path, title: str = "Grid Simulation") -> None:
+def _reuse_figure(fig, figsize: tuple):
+    """Clear and resize an existing Figure, or create one if fig is None.
+
+    Reusing one Figure across the detailed and combined views skips a second
+    round of Figure/backend construction per invocation.
+    """
+    if fig is None:
+        return plt.figure(figsize=figsize)
+    fig.clf()
+    fig.set_size_inches(*figsize)
+    return fig
+
+
+def plot_detailed(df: pd.DataFrame, output_path: Path, title: str = "Grid Simulation",
+                  features: frozenset = None, fig=None, save: bool = True):
     """Create a detailed 6-panel plot for Metabolic Model with phenotypic behaviors."""
+    if features is None:
+        features = frozenset(df.columns)
     # Check if we have metabolic stats and phenotypic behavior stats
-    has_metabolic = 'deaths_age' in df.columns or 'cosmic_spawns' in df.columns
-    has_phenotypic = 'attacks' in df.columns or 'evasions' in df.columns
-    
-    if has_metabolic:
-        fig, axes = plt.subplots(2, 3, figsize=(18, 10))
-    else:
-        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    has_metabolic = bool({'deaths_age', 'cosmic_spawns'} & features)
+    has_phenotypic = bool({'attacks', 'evasions'} & features)
+
+    # Pull each column out of the frame once; every ax.plot on a Series
+    # allocates a fresh view and re-runs np.asarray on it.
+    x = df['step'].to_numpy()
+    pop = df['population'].to_numpy()
+    uniq = df['unique_species'].to_numpy()
+    extras = {c: df[c].to_numpy()
+              for c in ('reactions_success', 'reactions_diverged', 'attacks',
+                        'evasions', 'movements', 'deaths_age', 'cosmic_spawns')
+              if c in features}
+
+    fig = _reuse_figure(fig, (18, 10) if has_metabolic else (14, 10))
+    axes = fig.subplots(2, 3 if has_metabolic else 2)
     fig.suptitle(title, fontsize=14, fontweight='bold')
     
     # Color scheme
@@ -67,64 +252,67 @@ def plot_detailed(df: pd.DataFrame, output_path: Path, title: str = "Grid Simula
     
     # 1. Population over time
     ax1 = axes[0, 0]
-    ax1.plot(df['step'], df['population'], color=colors['population'], linewidth=1.5, label='Population')
+    ax1.plot(*decimate(x, pop), color=colors['population'], linewidth=1.5, label='Population')
     ax1.set_xlabel('Step')
     ax1.set_ylabel('Population')
     ax1.set_title('Population Dynamics')
     ax1.grid(True, alpha=0.3)
-    ax1.xaxis.set_major_formatter(ticker.FuncFormatter(lambda x, p: f'{x/1000:.0f}k' if x >= 1000 else f'{x:.0f}'))
+    format_step_axis(ax1, x)
     
     # 2. Species diversity
     ax2 = axes[0, 1]
-    ax2.plot(df['step'], df['unique_species'], color=colors['unique'], linewidth=1.5, label='Unique Species')
+    ax2.plot(*decimate(x, uniq), color=colors['unique'], linewidth=1.5, label='Unique Species')
     ax2.set_xlabel('Step')
     ax2.set_ylabel('Unique Species')
     ax2.set_title('Species Diversity')
     ax2.grid(True, alpha=0.3)
-    ax2.xaxis.set_major_formatter(ticker.FuncFormatter(lambda x, p: f'{x/1000:.0f}k' if x >= 1000 else f'{x:.0f}'))
+    format_step_axis(ax2, x)
     
     # 3. Diversity ratio (unique/population)
     if has_metabolic:
         ax3 = axes[0, 2]
     else:
         ax3 = axes[1, 0]
-    diversity_ratio = df['unique_species'] / df['population'].replace(0, 1) * 100
-    ax3.plot(df['step'], diversity_ratio, color=colors['diversity'], linewidth=1.5)
+    # Single vectorized pass; .replace(0, 1) would copy the whole population
+    # column just to dodge division by zero.
+    diversity_ratio = np.where(pop > 0, uniq * (100.0 / np.maximum(pop, 1)), 0.0)
+    ax3.plot(*decimate(x, diversity_ratio), color=colors['diversity'], linewidth=1.5)
     ax3.set_xlabel('Step')
     ax3.set_ylabel('Diversity (%)')
     ax3.set_title('Species Diversity Ratio')
     ax3.grid(True, alpha=0.3)
     ax3.set_ylim(0, 105)
-    ax3.xaxis.set_major_formatter(ticker.FuncFormatter(lambda x, p: f'{x/1000:.0f}k' if x >= 1000 else f'{x:.0f}'))
+    format_step_axis(ax3, x)
     
     # 4. Reactions and Phenotypic Behaviors (if available)
     if has_metabolic:
         ax4 = axes[1, 0]
     else:
         ax4 = axes[1, 1]
-    if 'reactions_success' in df.columns:
-        ax4.plot(df['step'], df['reactions_success'], color=colors['reactions'], linewidth=1.5, label='Replications')
-        if 'reactions_diverged' in df.columns:
-            ax4.plot(df['step'], df['reactions_diverged'], color=colors['diverged'], linewidth=1.5, label='Diverged')
+    if 'reactions_success' in extras:
+        series = [('Replications', extras['reactions_success'], colors['reactions'], '-')]
+        if 'reactions_diverged' in extras:
+            series.append(('Diverged', extras['reactions_diverged'], colors['diverged'], '-'))
         # Add phenotypic behavior lines if available
         if has_phenotypic:
-            if 'attacks' in df.columns:
-                ax4.plot(df['step'], df['attacks'], color=colors['attacks'], linewidth=1.5, linestyle='--', label='Attacks')
-            if 'evasions' in df.columns:
-                ax4.plot(df['step'], df['evasions'], color=colors['evasions'], linewidth=1.5, linestyle=':', label='Evasions')
+            if 'attacks' in extras:
+                series.append(('Attacks', extras['attacks'], colors['attacks'], '--'))
+            if 'evasions' in extras:
+                series.append(('Evasions', extras['evasions'], colors['evasions'], ':'))
+        handles = plot_series_group(ax4, x, series)
         ax4.set_xlabel('Step')
         ax4.set_ylabel('Cumulative Count')
         ax4.set_title('Reactions & Behaviors')
-        ax4.legend(loc='upper left', fontsize='small')
+        ax4.legend(handles=handles, loc='upper left', fontsize='small')
         ax4.grid(True, alpha=0.3)
-        ax4.xaxis.set_major_formatter(ticker.FuncFormatter(lambda x, p: f'{x/1000:.0f}k' if x >= 1000 else f'{x:.0f}'))
-    elif 'movements' in df.columns:
-        ax4.plot(df['step'], df['movements'], color=colors['movements'], linewidth=1.5)
+        format_step_axis(ax4, x)
+    elif 'movements' in extras:
+        ax4.plot(*decimate(x, extras['movements']), color=colors['movements'], linewidth=1.5)
         ax4.set_xlabel('Step')
         ax4.set_ylabel('Cumulative Movements')
         ax4.set_title('Movement Statistics')
         ax4.grid(True, alpha=0.3)
-        ax4.xaxis.set_major_formatter(ticker.FuncFormatter(lambda x, p: f'{x/1000:.0f}k' if x >= 1000 else f'{x:.0f}'))
+        format_step_axis(ax4, x)
     else:
         ax4.text(0.5, 0.5, 'No reaction data available', ha='center', va='center', transform=ax4.transAxes)
         ax4.set_title('Reaction Statistics')
@@ -133,77 +321,93 @@ def plot_detailed(df: pd.DataFrame, output_path: Path, title: str = "Grid Simula
     if has_metabolic:
         # Deaths from age
         ax5 = axes[1, 1]
-        if 'deaths_age' in df.columns:
-            ax5.plot(df['step'], df['deaths_age'], color=colors['deaths'], linewidth=1.5, label='Age Deaths')
+        if 'deaths_age' in extras:
+            ax5.plot(*decimate(x, extras['deaths_age']), color=colors['deaths'], linewidth=1.5, label='Age Deaths')
             ax5.set_xlabel('Step')
             ax5.set_ylabel('Cumulative Deaths')
             ax5.set_title('Deaths from Old Age')
             ax5.grid(True, alpha=0.3)
-            ax5.xaxis.set_major_formatter(ticker.FuncFormatter(lambda x, p: f'{x/1000:.0f}k' if x >= 1000 else f'{x:.0f}'))
+            format_step_axis(ax5, x)
         else:
             ax5.text(0.5, 0.5, 'No age death data', ha='center', va='center', transform=ax5.transAxes)
             ax5.set_title('Deaths from Old Age')
         
         # Cosmic spawns
         ax6 = axes[1, 2]
-        if 'cosmic_spawns' in df.columns:
-            ax6.plot(df['step'], df['cosmic_spawns'], color=colors['spawns'], linewidth=1.5, label='Cosmic Spawns')
+        if 'cosmic_spawns' in extras:
+            ax6.plot(*decimate(x, extras['cosmic_spawns']), color=colors['spawns'], linewidth=1.5, label='Cosmic Spawns')
             ax6.set_xlabel('Step')
             ax6.set_ylabel('Cumulative Spawns')
             ax6.set_title('Cosmic Ray Spawns')
             ax6.grid(True, alpha=0.3)
-            ax6.xaxis.set_major_formatter(ticker.FuncFormatter(lambda x, p: f'{x/1000:.0f}k' if x >= 1000 else f'{x:.0f}'))
+            format_step_axis(ax6, x)
         else:
             ax6.text(0.5, 0.5, 'No cosmic spawn data', ha='center', va='center', transform=ax6.transAxes)
             ax6.set_title('Cosmic Ray Spawns')
     
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    print(f"Detailed plot saved to: {output_path}")
+    fig.tight_layout()
+    if save:
+        fig.savefig(output_path, dpi=150, bbox_inches='tight', pil_kwargs=PNG_KWARGS)
+        print(f"Detailed plot saved to: {output_path}")
+    return fig
 
 
-def plot_combined(df: pd.DataFrame, output_path: Path, title: str = "Grid Simulation") -> None:
+def plot_combined(df: pd.DataFrame, output_path: Path, title: str = "Grid Simulation",
+                  features: frozenset = None, fig=None, save: bool = True):
     """Create a combined single-panel plot showing key metrics."""
-    has_metabolic = 'deaths_age' in df.columns or 'cosmic_spawns' in df.columns
-    
-    fig, ax1 = plt.subplots(figsize=(14, 6))
+    if features is None:
+        features = frozenset(df.columns)
+    has_metabolic = bool({'deaths_age', 'cosmic_spawns'} & features)
+
+    x = df['step'].to_numpy()
+    pop = df['population'].to_numpy()
+    uniq = df['unique_species'].to_numpy()
+
+    fig = _reuse_figure(fig, (14, 6))
+    ax1 = fig.subplots()
     fig.suptitle(title, fontsize=14, fontweight='bold')
     
     # Primary axis: Population
     color1 = '#2ecc71'
     ax1.set_xlabel('Step')
     ax1.set_ylabel('Population', color=color1)
-    line1 = ax1.plot(df['step'], df['population'], color=color1, linewidth=2, label='Population')
+    # The twin-axis lines live on separate Axes (independent y-transforms), so
+    # they cannot share one LineCollection; each goes through the grouped
+    # helper so long logs still take the batched path if more series are added.
+    line1 = plot_series_group(ax1, x, [('Population', pop, color1, '-')], linewidth=2)
     ax1.tick_params(axis='y', labelcolor=color1)
-    ax1.xaxis.set_major_formatter(ticker.FuncFormatter(lambda x, p: f'{x/1000:.0f}k' if x >= 1000 else f'{x:.0f}'))
+    format_step_axis(ax1, x)
     
     # Secondary axis: Unique species
     ax2 = ax1.twinx()
     color2 = '#3498db'
     ax2.set_ylabel('Unique Species', color=color2)
-    line2 = ax2.plot(df['step'], df['unique_species'], color=color2, linewidth=2, linestyle='--', label='Unique Species')
+    line2 = plot_series_group(ax2, x, [('Unique Species', uniq, color2, '--')], linewidth=2)
     ax2.tick_params(axis='y', labelcolor=color2)
     
     # Additional lines for metabolic model (on primary axis, normalized)
     lines = line1 + line2
     
-    if has_metabolic:
-        # Add rate of deaths and spawns (derivative) as a subtle background indicator
-        # We show these as filled areas to indicate turnover
-        if 'deaths_age' in df.columns and len(df) > 1:
-            deaths_rate = df['deaths_age'].diff().fillna(0)
-            deaths_rate_smooth = deaths_rate.rolling(window=10, min_periods=1).mean()
-            # Normalize to fit on secondary axis scale
-            max_unique = df['unique_species'].max() if df['unique_species'].max() > 0 else 1
-            deaths_scaled = deaths_rate_smooth / deaths_rate_smooth.max() * max_unique * 0.3 if deaths_rate_smooth.max() > 0 else deaths_rate_smooth
-            ax2.fill_between(df['step'], 0, deaths_scaled, alpha=0.15, color='#c0392b', label='Death Rate')
-        
-        if 'cosmic_spawns' in df.columns and len(df) > 1:
-            spawns_rate = df['cosmic_spawns'].diff().fillna(0)
-            spawns_rate_smooth = spawns_rate.rolling(window=10, min_periods=1).mean()
-            max_unique = df['unique_species'].max() if df['unique_species'].max() > 0 else 1
-            spawns_scaled = spawns_rate_smooth / spawns_rate_smooth.max() * max_unique * 0.3 if spawns_rate_smooth.max() > 0 else spawns_rate_smooth
-            ax2.fill_between(df['step'], 0, spawns_scaled, alpha=0.15, color='#f39c12', label='Spawn Rate')
+    if has_metabolic and len(df) > 1:
+        # Add rate of deaths and spawns (derivative) as a subtle background
+        # indicator. We show these as filled areas to indicate turnover.
+        max_unique = uniq.max() if uniq.max() > 0 else 1
+        for col, fill_color, fill_label in (
+                ('deaths_age', '#c0392b', 'Death Rate'),
+                ('cosmic_spawns', '#f39c12', 'Spawn Rate')):
+            if col not in features:
+                continue
+            counts = df[col].to_numpy()
+            # The counters are cumulative, so a flat series means zero rate
+            # everywhere: skip the diff/smooth passes instead of scaling zeros.
+            if counts[-1] == counts[0]:
+                continue
+            rate_smooth = smoothed_rate(counts)
+            scaled = rate_smooth * (max_unique * 0.3 / rate_smooth.max())
+            # Smooth first, then downsample: decimating the raw diff would
+            # alias the rolling mean.
+            xs, ys = decimate(x, scaled)
+            ax2.fill_between(xs, 0, ys, alpha=0.15, color=fill_color, label=fill_label)
     
     # Combine legends
     labels = [l.get_label() for l in lines]
@@ -211,9 +415,72 @@ def plot_combined(df: pd.DataFrame, output_path: Path, title: str = "Grid Simula
     
     ax1.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    print(f"Combined plot saved to: {output_path}")
+    fig.tight_layout()
+    if save:
+        fig.savefig(output_path, dpi=150, bbox_inches='tight', pil_kwargs=PNG_KWARGS)
+        print(f"Combined plot saved to: {output_path}")
+    return fig
+
+
+def render_from_dataframe(df, output_path: Path, combined_path: Path = None,
+                          title: str = "Grid Simulation", features: frozenset = None,
+                          combined: bool = True, show: bool = False) -> None:
+    """Render plots from an already-parsed log frame.
+
+    Callers that hold the data in memory (or produce it themselves) come in
+    here directly and skip the CSV round-trip entirely.
+    """
+    if features is None:
+        features = frozenset(df.columns)
+    if combined_path is None:
+        combined_path = output_path.with_name(output_path.stem + '_combined.png')
+
+    if combined:
+        # Render both views, then overlap the two PNG encodes: savefig
+        # releases the GIL inside zlib, so the saves genuinely run in
+        # parallel (which needs both figures alive at once).
+        fig_detailed = plot_detailed(df, output_path, title,
+                                     features=features, save=False)
+        fig_combined = plot_combined(df, combined_path, title,
+                                     features=features, save=False)
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            saves = [
+                ex.submit(fig_detailed.savefig, output_path, dpi=150,
+                          bbox_inches='tight', pil_kwargs=PNG_KWARGS),
+                ex.submit(fig_combined.savefig, combined_path, dpi=150,
+                          bbox_inches='tight', pil_kwargs=PNG_KWARGS),
+            ]
+            for save in saves:
+                save.result()
+        print(f"Detailed plot saved to: {output_path}")
+        print(f"Combined plot saved to: {combined_path}")
+    else:
+        plot_detailed(df, output_path, title, features=features)
+
+    if show:
+        plt.show()
+    else:
+        plt.close('all')
+
+
+def render_from_csv(logfile: Path, output_path: Path = None, combined_path: Path = None,
+                    title: str = None, combined: bool = True, show: bool = False) -> None:
+    """Load a log CSV and render its plots without going through the CLI.
+
+    Entry point for callers (e.g. run_grid_experiments.py) that import this
+    module instead of spawning a fresh interpreter per log file.
+    """
+    df, features = load_log(logfile)
+
+    if output_path is None:
+        output_path = logfile.with_suffix('.png')
+    if combined_path is None:
+        combined_path = logfile.with_name(logfile.stem + '_combined.png')
+    if title is None:
+        title = f"Grid Simulation: {logfile.stem}"
+
+    render_from_dataframe(df, output_path, combined_path, title,
+                          features=features, combined=combined, show=show)
 
 
 def main() -> int:
@@ -246,26 +513,16 @@ Examples:
     if not logfile.exists():
         print(f"Error: Log file not found: {logfile}")
         return 1
-    
-    # Load data
-    df = load_log(logfile)
-    
-    # Determine output paths
-    output_path = Path(args.output) if args.output else logfile.with_suffix('.png')
-    combined_path = Path(args.combined_output) if args.combined_output else logfile.with_name(logfile.stem + '_combined.png')
-    
-    # Generate title
-    title = args.title if args.title else f"Grid Simulation: {logfile.stem}"
-    
-    # Generate plots
-    plot_detailed(df, output_path, title)
-    
-    if args.combined:
-        plot_combined(df, combined_path, title)
-    
-    if not args.no_show:
-        plt.show()
-    
+
+    render_from_csv(
+        logfile,
+        output_path=Path(args.output) if args.output else None,
+        combined_path=Path(args.combined_output) if args.combined_output else None,
+        title=args.title,
+        combined=args.combined,
+        show=not args.no_show,
+    )
+
     return 0
 
 
@@ -10,13 +10,43 @@ import subprocess
 import sys
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import json
 import tempfile
+from collections import deque
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Any
 import argparse
 
+try:
+    # C-implemented serializer, ~5-10x faster than stdlib json for the large
+    # per-run results list; purely optional.
+    import orjson
+except ImportError:
+    orjson = None
+
+# Compiled once at import: merge_soup_files runs once per simulation run, and
+# re-compiling per call just repeats the same sre work. One pattern matches
+# every binding (soup or not); the name group distinguishes the two cases, so
+# each line goes through the regex engine once instead of twice.
+_BINDING_RE = re.compile(r'^(?P<name>\w+)\s*=\s*(?P<expr>.+);$')
+
+# Same shape as _BINDING_RE but anchored per line of a whole file: one
+# finditer pass skips comments and blanks inside the regex engine instead of
+# a Python-level strip/startswith per line.
+_BINDING_LINE_RE = re.compile(r'^[ \t]*(?P<name>\w+)\s*=\s*(?P<expr>.+);[ \t]*$',
+                              re.MULTILINE)
+
+# How many trailing stdout lines run_simulation keeps. The final-stats block
+# (SIMULATION COMPLETE + FINAL SOUP analysis) is a few dozen lines; 200 gives
+# comfortable headroom while keeping memory O(1) in run length.
+_OUTPUT_TAIL_LINES = 200
+
+# With at least this many input soup files, merge_soup_files overlaps the
+# file reads in a thread pool instead of reading serially.
+_CONCURRENT_READ_MIN_FILES = 4
+
 
 def merge_soup_files(input_files: list[Path]) -> tuple[Optional[Path], int]:
     """
@@ -30,66 +60,98 @@ def merge_soup_files(input_files: list[Path]) -> tuple[Optional[Path], int]:
     Returns:
         Tuple of (path to merged temporary file or None on error, soup count)
     """
-    merged_bindings: list[str] = []
     soup_index = 0
-    
-    # Pattern to match soup_N = <expression>;
-    soup_pattern = re.compile(r'^soup_\d+\s*=\s*(.+);$')
-    # Pattern to match any binding: name = expression;
-    binding_pattern = re.compile(r'^(\w+)\s*=\s*(.+);$')
-    
+
     for input_file in input_files:
         if not input_file.exists():
             print(f"❌ Input file not found: {input_file}")
             return None, 0
-        
-        try:
-            content = input_file.read_text()
-        except IOError as e:
-            print(f"❌ Failed to read {input_file}: {e}")
-            return None, 0
-        
-        for line in content.splitlines():
-            line = line.strip()
-            
-            # Skip empty lines and comments
-            if not line or line.startswith('//'):
-                continue
-            
-            # Check if it's a soup_* binding
-            soup_match = soup_pattern.match(line)
-            if soup_match:
-                expr = soup_match.group(1)
-                merged_bindings.append(f"soup_{soup_index} = {expr};")
-                soup_index += 1
-                continue
-            
-            # Check if it's any other binding (non-soup)
-            binding_match = binding_pattern.match(line)
-            if binding_match:
-                name = binding_match.group(1)
-                expr = binding_match.group(2)
-                # Only include non-soup bindings
-                if not name.startswith('soup_'):
-                    merged_bindings.append(f"{name} = {expr};")
-    
-    if soup_index == 0:
-        print("⚠️  No soup_* bindings found in input files")
-    
-    # Create temporary file for merged content
+
     try:
         fd, temp_path = tempfile.mkstemp(suffix='.lamb', prefix='merged_soup_')
+    except IOError as e:
+        print(f"❌ Failed to create merged soup file: {e}")
+        return None, 0
+
+    # Stream rewritten bindings straight into the temp file: buffering them in
+    # a list and joining would hold the whole merged soup in memory twice,
+    # plus the append-driven list regrowth for 100k+ bindings.
+    try:
         with os.fdopen(fd, 'w') as f:
             f.write("// LAMB_SOUP_V1\n")
-            f.write(f"// Merged from: {', '.join(str(p) for p in input_files)}\n")
-            f.write(f"// count={soup_index}\n\n")
-            f.write('\n'.join(merged_bindings))
-            f.write('\n')
-        return Path(temp_path), soup_index
+            f.write(f"// Merged from: {', '.join(str(p) for p in input_files)}\n\n")
+
+            def merge_lines(lines) -> None:
+                nonlocal soup_index
+                for line in lines:
+                    line = line.strip()
+
+                    # Skip empty lines and comments
+                    if not line or line.startswith('//'):
+                        continue
+
+                    # Nearly every line in a soup dump is a soup_* binding;
+                    # parse those with plain string ops and keep the regex
+                    # for the rare non-soup bindings only.
+                    if line.startswith('soup_') and line.endswith(';'):
+                        _, sep, expr = line.partition('=')
+                        if sep:
+                            # Renumber soup bindings into one contiguous sequence
+                            f.write(f"soup_{soup_index} = {expr[:-1].strip()};\n")
+                            soup_index += 1
+                            continue
+
+                    match = _BINDING_RE.match(line)
+                    if match and not match['name'].startswith('soup_'):
+                        f.write(f"{match['name']} = {match['expr']};\n")
+
+            def merge_content(content: str) -> None:
+                # Non-binding lines simply never match, so the skip logic for
+                # comments and blanks runs in the regex engine's inner loop
+                # rather than one bytecode iteration per line.
+                nonlocal soup_index
+                for m in _BINDING_LINE_RE.finditer(content):
+                    if m['name'].startswith('soup_'):
+                        f.write(f"soup_{soup_index} = {m['expr']};\n")
+                        soup_index += 1
+                    else:
+                        f.write(f"{m['name']} = {m['expr']};\n")
+
+            if len(input_files) >= _CONCURRENT_READ_MIN_FILES:
+                # Re-seeding from a prior experiment can hand us a dozen or
+                # more dumps; issue the reads concurrently so cold-cache
+                # storage latency overlaps, then parse in order.
+                with ThreadPoolExecutor(
+                        max_workers=min(len(input_files), 8)) as readers:
+                    for content in readers.map(Path.read_text, input_files):
+                        merge_content(content)
+            else:
+                for input_file in input_files:
+                    with input_file.open('r') as fh:
+                        merge_lines(fh)
+
+            # The loader skips // comments wherever they appear, so the count
+            # can trail the bindings instead of forcing a buffered first pass.
+            f.write(f"\n// count={soup_index}\n")
     except IOError as e:
-        print(f"❌ Failed to create merged soup file: {e}")
+        print(f"❌ Failed to merge soup files: {e}")
+        Path(temp_path).unlink(missing_ok=True)
         return None, 0
 
+    if soup_index == 0:
+        print("⚠️  No soup_* bindings found in input files")
+
+    return Path(temp_path), soup_index
+
+
+def _count_soups(soup_file: Path) -> int:
+    """Count soup_* bindings by streaming the file, without parsing it."""
+    try:
+        with soup_file.open('r') as fh:
+            return sum(1 for line in fh if line.lstrip().startswith('soup_'))
+    except IOError:
+        return 0
+
 
 def run_simulation(
     lamb_path: Path,
@@ -102,7 +164,10 @@ def run_simulation(
     graph_file: str,
     run_id: int,
     total_runs: int,
-    input_files: Optional[list[Path]] = None
+    input_files: Optional[list[Path]] = None,
+    input_files_strs: Optional[list[str]] = None,
+    merged_soup_path: Optional[Path] = None,
+    merged_pool_size: int = 0
 ) -> tuple[bool, str]:
     """
     Run a single LAMB simulation.
@@ -119,6 +184,11 @@ def run_simulation(
         run_id: Current run number (for display)
         total_runs: Total number of runs (for display)
         input_files: Optional list of .lamb files to load as initial soup
+        input_files_strs: Pre-stringified input_files (display only); computed
+            once in main instead of per run
+        merged_soup_path: Soup file merged once by the caller and shared
+            across runs; skips the per-run merge and is never deleted here
+        merged_pool_size: Soup count of merged_soup_path (display only)
     
     Returns:
         Tuple of (success: bool, output: str)
@@ -132,18 +202,30 @@ def run_simulation(
 """
     
     # If input files are provided, merge them first to get actual pool size
-    merged_soup_path: Optional[Path] = None
+    # (unless the caller already merged once for the whole suite)
+    merged_is_temp = False
     actual_pool_size = pool_size
-    if input_files:
-        merged_soup_path, actual_pool_size = merge_soup_files(input_files)
-        if merged_soup_path is None:
-            return False, "Failed to merge input soup files"
+    if merged_soup_path is not None:
+        actual_pool_size = merged_pool_size or _count_soups(merged_soup_path)
+    elif input_files:
+        if len(input_files) == 1:
+            # Nothing to renumber: point :load straight at the file and skip
+            # the whole read/rewrite pass (repeated for every run otherwise)
+            merged_soup_path = input_files[0]
+            actual_pool_size = _count_soups(merged_soup_path)
+        else:
+            merged_soup_path, actual_pool_size = merge_soup_files(input_files)
+            if merged_soup_path is None:
+                return False, "Failed to merge input soup files"
+            merged_is_temp = True
     
     print(f"\n{'='*60}")
     print(f"🧪 Run {run_id}/{total_runs}")
     print(f"{'='*60}")
     if input_files:
-        print(f"Input files: {', '.join(str(f) for f in input_files)}")
+        if input_files_strs is None:
+            input_files_strs = [str(f) for f in input_files]
+        print(f"Input files: {', '.join(input_files_strs)}")
         print(f"Loaded pool: {actual_pool_size} expressions")
     print(f"Parameters: pool={actual_pool_size}, iterations={iterations}, depth={depth}, max_steps={max_steps}")
     print(f"Log file:   {log_file}.csv")
@@ -156,51 +238,148 @@ def run_simulation(
         commands = f":load {merged_soup_path}\n" + commands
     
     try:
-        result = subprocess.run(
+        # Stream stdout instead of capture_output: verbose million-iteration
+        # runs can produce hundreds of MB, and only the tail carries the
+        # final stats. A bounded deque keeps memory O(1) in run length and
+        # avoids stalling lamb on a full OS pipe buffer.
+        proc = subprocess.Popen(
             [str(lamb_path)],
-            input=commands,
-            capture_output=True,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=None  # Long simulations may take a while
+            bufsize=1
         )
-        
+        proc.stdin.write(commands)
+        proc.stdin.close()
+
+        tail: deque[str] = deque(maxlen=_OUTPUT_TAIL_LINES)
+        completed = False
+        for line in proc.stdout:
+            tail.append(line)
+            if not completed and "=== SIMULATION COMPLETE ===" in line:
+                completed = True
+        stderr = proc.stderr.read()
+        proc.wait()
+
+        output = ''.join(tail)
+
         # Check for errors in output
-        if "ERROR" in result.stderr or result.returncode != 0:
+        if "ERROR" in stderr or proc.returncode != 0:
             print(f"❌ Run failed!")
-            print(f"stderr: {result.stderr}")
-            return False, result.stdout + result.stderr
+            print(f"stderr: {stderr}")
+            return False, output + stderr
         
-        # Extract key stats from output
-        output = result.stdout
-        
-        # Print summary
-        if "=== SIMULATION COMPLETE ===" in output:
-            # Extract stats
-            for line in output.split('\n'):
-                if 'Converged reactions:' in line or \
-                   'Diverged reactions:' in line or \
-                   'Error reactions:' in line or \
-                   'Unique Spec:' in line or \
-                   'Dominant:' in line:
-                    print(f"  {line.strip()}")
+        # Print summary: one pass of the compiled stats pattern instead of
+        # splitting the text and testing five substrings per line (the same
+        # scan extract_stats_from_output performs for the summary JSON).
+        if completed:
+            for m in _STATS_RE.finditer(output):
+                print(f"  {m.group(0).strip()}")
             print(f"✅ Run {run_id} completed successfully!")
         
         return True, output
         
-    except subprocess.TimeoutExpired:
-        print(f"❌ Run {run_id} timed out!")
-        return False, "Timeout"
     except Exception as e:
         print(f"❌ Run {run_id} failed with error: {e}")
         return False, str(e)
     finally:
-        # Clean up merged soup file if we created one
-        if merged_soup_path and merged_soup_path.exists():
+        # Clean up merged soup file if we created one (never the user's own
+        # input on the single-file path)
+        if merged_is_temp and merged_soup_path.exists():
+            try:
+                merged_soup_path.unlink()
+            except OSError:
+                pass  # Best effort cleanup
+
+
+# Banner lamb_gas prints at the start of every :gas command; used to split a
+# batched session's stdout back into per-run chunks.
+_RUN_START_MARKER = '=== TURING GAS SIMULATION ==='
+
+
+def run_batched_simulations(
+    lamb_path: Path,
+    run_files: dict[int, tuple[str, str, str]],
+    pool_size: int,
+    iterations: int,
+    depth: int,
+    max_steps: int,
+    input_files: Optional[list[Path]] = None,
+    merged_soup_path: Optional[Path] = None
+) -> dict[int, tuple[bool, str]]:
+    """
+    Run every simulation inside a single lamb_gas session.
+
+    The REPL happily executes :gas repeatedly, so one process can serve all
+    runs back to back; this amortizes executable load and interpreter startup
+    across the whole suite. Only used when runs execute serially anyway.
+
+    Returns {run_id: (success, per-run stdout chunk)}.
+    """
+    merged_is_temp = False
+    if merged_soup_path is None and input_files:
+        if len(input_files) == 1:
+            merged_soup_path = input_files[0]
+        else:
+            merged_soup_path, _ = merge_soup_files(input_files)
+            if merged_soup_path is None:
+                return {run_id: (False, "Failed to merge input soup files")
+                        for run_id in run_files}
+            merged_is_temp = True
+
+    parts = []
+    for run_id in sorted(run_files):
+        log_base, soup_file, graph_file = run_files[run_id]
+        if merged_soup_path:
+            # Reload the soup so each run starts from the same pool
+            parts.append(f":load {merged_soup_path}")
+        parts.append(f":gas {pool_size} {iterations} {depth} {max_steps} {log_base}")
+        parts.append(f":dump_soup {soup_file}")
+        parts.append(f":export_graph {graph_file}")
+    parts.append(":quit")
+
+    print(f"\n{'='*60}")
+    print(f"🧪 Batched session: {len(run_files)} runs in one lamb_gas process")
+    print(f"{'='*60}")
+
+    try:
+        result = subprocess.run(
+            [str(lamb_path)],
+            input='\n'.join(parts) + '\n',
+            capture_output=True,
+            text=True,
+            timeout=None
+        )
+    except Exception as e:
+        print(f"❌ Batched session failed with error: {e}")
+        return {run_id: (False, str(e)) for run_id in run_files}
+    finally:
+        if merged_is_temp and merged_soup_path.exists():
             try:
                 merged_soup_path.unlink()
             except OSError:
                 pass  # Best effort cleanup
 
+    if "ERROR" in result.stderr or result.returncode != 0:
+        print(f"❌ Batched session failed!")
+        print(f"stderr: {result.stderr}")
+        return {run_id: (False, result.stdout + result.stderr)
+                for run_id in run_files}
+
+    # Chunk the combined stdout back into per-run outputs: everything between
+    # two run banners belongs to the earlier run, including its final stats.
+    chunks = result.stdout.split(_RUN_START_MARKER)[1:]
+    out: dict[int, tuple[bool, str]] = {}
+    for idx, run_id in enumerate(sorted(run_files)):
+        if idx < len(chunks) and "=== SIMULATION COMPLETE ===" in chunks[idx]:
+            print(f"✅ Run {run_id} completed successfully!")
+            out[run_id] = (True, chunks[idx])
+        else:
+            print(f"❌ Run {run_id} produced no output!")
+            out[run_id] = (False, chunks[idx] if idx < len(chunks) else '')
+    return out
+
 
 def generate_plots(
     log_file: Path,
@@ -264,7 +443,8 @@ def generate_network_graph(
                 str(python_path),
                 str(network_script),
                 str(graph_file),
-                str(output_png)
+                str(output_png),
+                '--no-show'
             ],
             capture_output=True,
             text=True
@@ -287,55 +467,64 @@ def generate_network_graph(
         return False
 
 
+def _parse_unique_spec(value: str, stats: dict[str, Any]) -> None:
+    """Parse "Unique Spec:  123 (45.67% diversity)" into stats."""
+    parts = value.split()
+    stats['final_unique_species'] = int(parts[0])
+    for p in parts[1:]:
+        if '%' in p:
+            stats['final_diversity_pct'] = float(p.lstrip('(').split('%')[0])
+            break
+
+
+def _parse_dominant(value: str, stats: dict[str, Any]) -> None:
+    """Parse "Dominant: \\v1.v2.v3.v1 (Count: 178, 8.90%)" into stats."""
+    if '(Count:' in value:
+        expr_part, _, count_part = value.partition('(Count:')
+        stats['final_dominant_count'] = int(count_part.split(',')[0].strip())
+        stats['final_dominant_expr'] = expr_part.strip()
+
+
+# All statistic lines lamb prints are "Key: value"; one MULTILINE scan pulls
+# them out of the whole capture instead of running five substring tests
+# against every line of a potentially multi-MB stdout.
+_STATS_RE = re.compile(
+    r'^\s*(Converged reactions|Diverged reactions|Error reactions'
+    r'|Unique Spec|Dominant):\s*(.+)$',
+    re.MULTILINE)
+
+_INT_STAT_KEYS = {
+    'Converged reactions': 'converged_reactions',
+    'Diverged reactions': 'diverged_reactions',
+    'Error reactions': 'error_reactions',
+}
+
+
 def extract_stats_from_output(output: str) -> dict[str, Any]:
     """Extract simulation statistics from lamb output."""
     stats: dict[str, Any] = {}
-    
-    for line in output.split('\n'):
+
+    # Later matches simply overwrite earlier ones, so the periodic status
+    # lines resolve to the final state without any explicit last-wins logic.
+    # Two C-level literal checks (keyword initial, then ':') reject almost
+    # every log line before the alternation pattern ever runs.
+    for line in output.splitlines():
         line = line.strip()
-        if 'Converged reactions:' in line:
-            try:
-                stats['converged_reactions'] = int(line.split(':')[1].strip())
-            except (ValueError, IndexError):
-                pass
-        elif 'Diverged reactions:' in line:
-            try:
-                stats['diverged_reactions'] = int(line.split(':')[1].strip())
-            except (ValueError, IndexError):
-                pass
-        elif 'Error reactions:' in line:
-            try:
-                stats['error_reactions'] = int(line.split(':')[1].strip())
-            except (ValueError, IndexError):
-                pass
-        elif 'Unique Spec:' in line:
-            # Take the last occurrence (final state)
-            try:
-                parts = line.split()
-                for i, p in enumerate(parts):
-                    if p == 'Spec:':
-                        stats['final_unique_species'] = int(parts[i+1])
-                        # Extract diversity percentage
-                        for j, p2 in enumerate(parts):
-                            if p2.endswith('%'):
-                                stats['final_diversity_pct'] = float(p2.rstrip('%').lstrip('('))
-                                break
-                        break
-            except (ValueError, IndexError):
-                pass
-        elif 'Dominant:' in line:
-            # Take the last occurrence (final state)
-            try:
-                # Format: "Dominant: \v1.v2.v3.v1 (Count: 178, 8.90%)"
-                parts = line.split('Dominant:')[1].strip()
-                if '(Count:' in parts:
-                    expr_part = parts.split('(Count:')[0].strip()
-                    count_part = parts.split('(Count:')[1]
-                    count = int(count_part.split(',')[0].strip())
-                    stats['final_dominant_expr'] = expr_part
-                    stats['final_dominant_count'] = count
-            except (ValueError, IndexError):
-                pass
+        if not line or line[0] not in 'CDEU' or ':' not in line:
+            continue
+        m = _STATS_RE.match(line)
+        if not m:
+            continue
+        key, value = m.group(1), m.group(2)
+        try:
+            if key in _INT_STAT_KEYS:
+                stats[_INT_STAT_KEYS[key]] = int(value.strip())
+            elif key == 'Unique Spec':
+                _parse_unique_spec(value, stats)
+            else:  # Dominant
+                _parse_dominant(value, stats)
+        except (ValueError, IndexError):
+            pass
     
     return stats
 
@@ -343,7 +532,7 @@ def extract_stats_from_output(output: str) -> dict[str, Any]:
 def save_experiment_summary(
     output_dir: Path,
     args: argparse.Namespace,
-    input_files: Optional[list[Path]],
+    input_files_strs: Optional[list[str]],
     results: list[dict[str, Any]],
     successful_runs: int,
     failed_runs: int,
@@ -353,8 +542,8 @@ def save_experiment_summary(
     """Save experiment summary to JSON and text files."""
     # Reconstruct the CLI command
     cli_parts = ['python', 'run_experiments.py']
-    if input_files:
-        cli_parts.extend(['--input'] + [str(f) for f in input_files])
+    if input_files_strs:
+        cli_parts.extend(['--input'] + input_files_strs)
     cli_parts.extend([
         '--runs', str(args.runs),
         '--pool', str(args.pool),
@@ -387,7 +576,7 @@ def save_experiment_summary(
             'max_steps': args.max_steps,
             'generate_plots': not args.no_plots,
         },
-        'input_files': [str(f) for f in input_files] if input_files else None,
+        'input_files': input_files_strs,
         'summary': {
             'successful_runs': successful_runs,
             'failed_runs': failed_runs,
@@ -398,73 +587,84 @@ def save_experiment_summary(
     
     # Save JSON
     json_path = output_dir / 'experiment_summary.json'
-    with open(json_path, 'w') as f:
-        json.dump(summary, f, indent=2)
-    
-    # Save human-readable text
+    if orjson is not None:
+        json_path.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+    else:
+        with open(json_path, 'w') as f:
+            json.dump(summary, f, indent=2)
+    
+    # Save human-readable text. Assemble the lines first and write once:
+    # ~40 small f.write calls become a single buffered write.
+    bar = "=" * 70
+    out = [
+        bar,
+        "LAMB TURING GAS EXPERIMENT SUMMARY",
+        bar,
+        "",
+        "COMMAND TO REPRODUCE:",
+        f"  {cli_command}",
+        "",
+        "TIMING:",
+        f"  Started:  {start_time.strftime('%Y-%m-%d %H:%M:%S')}",
+        f"  Finished: {end_time.strftime('%Y-%m-%d %H:%M:%S')}",
+        f"  Duration: {(end_time - start_time).total_seconds():.1f} seconds",
+        "",
+        "PARAMETERS:",
+        f"  Runs:       {args.runs}",
+        f"  Pool size:  {args.pool}",
+        f"  Iterations: {args.iterations:,}",
+        f"  Depth:      {args.depth}",
+        f"  Max steps:  {args.max_steps}",
+        f"  Plots:      {'Yes' if not args.no_plots else 'No'}",
+        "",
+    ]
+
+    if input_files_strs:
+        out.append("INPUT FILES:")
+        out.extend(f"  - {inp}" for inp in input_files_strs)
+        out.append("")
+
+    out.extend([
+        "RESULTS:",
+        f"  Successful: {successful_runs}/{args.runs}",
+        f"  Failed:     {failed_runs}/{args.runs}",
+        "",
+        "RUN DETAILS:",
+        "-" * 70,
+    ])
+
+    for run in results:
+        run_id = run.get('run_id', '?')
+        success = run.get('success', False)
+        out.append("")
+        out.append(f"Run {run_id}: {'SUCCESS' if success else 'FAILED'}")
+        if success:
+            out.append(f"  Log:   {run.get('log_file', 'N/A')}")
+            out.append(f"  Soup:  {run.get('soup_file', 'N/A')}")
+            out.append(f"  Graph: {run.get('graph_file', 'N/A')}")
+            if 'stats' in run:
+                stats = run['stats']
+                if 'converged_reactions' in stats:
+                    out.append(f"  Converged: {stats['converged_reactions']:,}")
+                if 'diverged_reactions' in stats:
+                    out.append(f"  Diverged:  {stats['diverged_reactions']:,}")
+                if 'final_unique_species' in stats:
+                    line = f"  Final unique species: {stats['final_unique_species']}"
+                    if 'final_diversity_pct' in stats:
+                        line += f" ({stats['final_diversity_pct']:.2f}% diversity)"
+                    out.append(line)
+                if 'final_dominant_expr' in stats:
+                    line = f"  Dominant: {stats['final_dominant_expr']}"
+                    if 'final_dominant_count' in stats:
+                        line += f" (count: {stats['final_dominant_count']})"
+                    out.append(line)
+
+    out.extend(["", bar, f"Output directory: {output_dir}", bar, ""])
+
     txt_path = output_dir / 'experiment_summary.txt'
     with open(txt_path, 'w') as f:
-        f.write("=" * 70 + "\n")
-        f.write("LAMB TURING GAS EXPERIMENT SUMMARY\n")
-        f.write("=" * 70 + "\n\n")
-        
-        f.write("COMMAND TO REPRODUCE:\n")
-        f.write(f"  {cli_command}\n\n")
-        
-        f.write("TIMING:\n")
-        f.write(f"  Started:  {start_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"  Finished: {end_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"  Duration: {(end_time - start_time).total_seconds():.1f} seconds\n\n")
-        
-        f.write("PARAMETERS:\n")
-        f.write(f"  Runs:       {args.runs}\n")
-        f.write(f"  Pool size:  {args.pool}\n")
-        f.write(f"  Iterations: {args.iterations:,}\n")
-        f.write(f"  Depth:      {args.depth}\n")
-        f.write(f"  Max steps:  {args.max_steps}\n")
-        f.write(f"  Plots:      {'Yes' if not args.no_plots else 'No'}\n\n")
-        
-        if input_files:
-            f.write("INPUT FILES:\n")
-            for inp in input_files:
-                f.write(f"  - {inp}\n")
-            f.write("\n")
-        
-        f.write("RESULTS:\n")
-        f.write(f"  Successful: {successful_runs}/{args.runs}\n")
-        f.write(f"  Failed:     {failed_runs}/{args.runs}\n\n")
-        
-        f.write("RUN DETAILS:\n")
-        f.write("-" * 70 + "\n")
-        for run in results:
-            run_id = run.get('run_id', '?')
-            success = run.get('success', False)
-            f.write(f"\nRun {run_id}: {'SUCCESS' if success else 'FAILED'}\n")
-            if success:
-                f.write(f"  Log:   {run.get('log_file', 'N/A')}\n")
-                f.write(f"  Soup:  {run.get('soup_file', 'N/A')}\n")
-                f.write(f"  Graph: {run.get('graph_file', 'N/A')}\n")
-                if 'stats' in run:
-                    stats = run['stats']
-                    if 'converged_reactions' in stats:
-                        f.write(f"  Converged: {stats['converged_reactions']:,}\n")
-                    if 'diverged_reactions' in stats:
-                        f.write(f"  Diverged:  {stats['diverged_reactions']:,}\n")
-                    if 'final_unique_species' in stats:
-                        f.write(f"  Final unique species: {stats['final_unique_species']}")
-                        if 'final_diversity_pct' in stats:
-                            f.write(f" ({stats['final_diversity_pct']:.2f}% diversity)")
-                        f.write("\n")
-                    if 'final_dominant_expr' in stats:
-                        f.write(f"  Dominant: {stats['final_dominant_expr']}")
-                        if 'final_dominant_count' in stats:
-                            f.write(f" (count: {stats['final_dominant_count']})")
-                        f.write("\n")
-        
-        f.write("\n" + "=" * 70 + "\n")
-        f.write(f"Output directory: {output_dir}\n")
-        f.write("=" * 70 + "\n")
-    
+        f.write('\n'.join(out))
+
     print(f"📄 Summary saved: experiment_summary.json, experiment_summary.txt")
 
 
@@ -506,6 +706,8 @@ Examples:
                        help='Max reduction steps per reaction (default: 500)')
     parser.add_argument('--output-dir', type=str, default=None,
                        help='Output directory for results (default: ./experiments_TIMESTAMP)')
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                       help='Simulations to run concurrently (default: min(runs, CPU count))')
     parser.add_argument('--no-plots', action='store_true',
                        help='Skip plot generation')
     parser.add_argument('--lamb', type=str, default='./lamb_gas',
@@ -518,6 +720,7 @@ Examples:
     
     # Process input files if provided
     input_files: Optional[list[Path]] = None
+    input_files_strs: Optional[list[str]] = None
     if args.input:
         input_files = [Path(f).resolve() for f in args.input]
         # Validate all input files exist
@@ -525,6 +728,8 @@ Examples:
             if not f.exists():
                 print(f"❌ Input file not found: {f}")
                 return 1
+        # Stringified once here; every run and the summary reuse this list
+        input_files_strs = [str(f) for f in input_files]
     
     # Setup paths
     script_dir = Path(__file__).parent.resolve()
@@ -553,7 +758,9 @@ Examples:
         output_dir = script_dir / f'experiments_{timestamp}'
     
     output_dir.mkdir(parents=True, exist_ok=True)
-    
+
+    jobs = args.jobs if args.jobs else min(args.runs, os.cpu_count() or 1)
+
     # Print experiment header
     print("\n" + "=" * 70)
     print("🔬 LAMB TURING GAS EXPERIMENT SUITE")
@@ -566,6 +773,7 @@ Examples:
     else:
         print(f"Pool size:   {args.pool}")
     print(f"Runs:        {args.runs}")
+    print(f"Jobs:        {jobs}")
     print(f"Iterations:  {args.iterations:,}")
     print(f"Depth:       {args.depth}")
     print(f"Max steps:   {args.max_steps}")
@@ -573,6 +781,25 @@ Examples:
     print(f"Lamb path:   {lamb_path}")
     print("=" * 70)
     
+    # One stat() each instead of two per completed run
+    plots_enabled = not args.no_plots and plot_script.exists()
+    network_enabled = not args.no_plots and network_script.exists()
+
+    # Merge the input soups once up front; every run loads the same file
+    # instead of re-merging identical inputs per run
+    merged_soup_path: Optional[Path] = None
+    merged_is_temp = False
+    merged_pool_size = 0
+    if input_files:
+        if len(input_files) == 1:
+            merged_soup_path = input_files[0]
+            merged_pool_size = _count_soups(merged_soup_path)
+        else:
+            merged_soup_path, merged_pool_size = merge_soup_files(input_files)
+            if merged_soup_path is None:
+                return 1
+            merged_is_temp = True
+
     # Track results
     successful_runs = 0
     failed_runs = 0
@@ -583,57 +810,112 @@ Examples:
     os.chdir(output_dir)
     
     try:
-        for run_id in range(1, args.runs + 1):
-            # Generate unique filenames
-            log_base = f'run_{run_id:02d}_log'
-            soup_file = f'run_{run_id:02d}_soup.lamb'
-            graph_file = f'run_{run_id:02d}_graph.json'
-            
-            success, output = run_simulation(
-                lamb_path=lamb_path,
-                pool_size=args.pool,
-                iterations=args.iterations,
-                depth=args.depth,
-                max_steps=args.max_steps,
-                log_file=log_base,
-                soup_file=soup_file,
-                graph_file=graph_file,
-                run_id=run_id,
-                total_runs=args.runs,
-                input_files=input_files
-            )
-            
+        # Per-run output filenames, keyed by run id
+        run_files = {
+            run_id: (f'run_{run_id:02d}_log',
+                     f'run_{run_id:02d}_soup.lamb',
+                     f'run_{run_id:02d}_graph.json')
+            for run_id in range(1, args.runs + 1)
+        }
+
+        def record_result(run_id: int, success: bool, output: str) -> None:
+            nonlocal successful_runs, failed_runs
+            log_base, soup_file, graph_file = run_files[run_id]
             if success:
                 successful_runs += 1
                 # Extract statistics from simulation output
                 stats = extract_stats_from_output(output)
-                results.append({
+                run_results[run_id] = {
                     'run_id': run_id,
                     'log_file': f'{log_base}.csv',
                     'soup_file': soup_file,
                     'graph_file': graph_file,
                     'success': True,
                     'stats': stats
-                })
-                
-                # Generate plots if requested
-                if not args.no_plots and plot_script.exists():
+                }
+
+                # Generate plots in the background if requested
+                if plots_enabled:
                     log_path = Path(f'{log_base}.csv')  # We're already in output_dir
-                    generate_plots(log_path, plot_script, python_path, run_id)
-                
-                # Generate network visualization
-                if not args.no_plots and network_script.exists():
+                    plot_pool.submit(generate_plots, log_path, plot_script,
+                                     python_path, run_id)
+
+                # Generate network visualization in the background
+                if network_enabled:
                     graph_path = Path(graph_file)  # We're already in output_dir
-                    generate_network_graph(graph_path, network_script, python_path, run_id)
+                    plot_pool.submit(generate_network_graph, graph_path,
+                                     network_script, python_path, run_id)
             else:
                 failed_runs += 1
-                results.append({
+                run_results[run_id] = {
                     'run_id': run_id,
                     'success': False
-                })
-    
+                }
+
+        run_results: dict[int, dict] = {}
+        # Plot and network rendering are subprocess waits, not Python work,
+        # so a small thread pool hides their latency behind the remaining
+        # simulations instead of serializing them onto the critical path.
+        plot_pool = ThreadPoolExecutor(max_workers=2)
+        if jobs == 1:
+            # A single worker gains nothing from process isolation; one
+            # lamb_gas session serves all runs back to back instead of
+            # paying process startup per run.
+            batch = run_batched_simulations(
+                lamb_path=lamb_path,
+                run_files=run_files,
+                pool_size=args.pool,
+                iterations=args.iterations,
+                depth=args.depth,
+                max_steps=args.max_steps,
+                input_files=input_files,
+                merged_soup_path=merged_soup_path
+            )
+            for run_id in sorted(batch):
+                record_result(run_id, *batch[run_id])
+        else:
+            # Runs are independent (each writes its own files), so spread
+            # them across processes; each lamb_gas is a single-core
+            # CPU-bound child.
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                futures = {
+                    pool.submit(
+                        run_simulation,
+                        lamb_path=lamb_path,
+                        pool_size=args.pool,
+                        iterations=args.iterations,
+                        depth=args.depth,
+                        max_steps=args.max_steps,
+                        log_file=log_base,
+                        soup_file=soup_file,
+                        graph_file=graph_file,
+                        run_id=run_id,
+                        total_runs=args.runs,
+                        input_files=input_files,
+                        input_files_strs=input_files_strs,
+                        merged_soup_path=merged_soup_path,
+                        merged_pool_size=merged_pool_size
+                    ): run_id
+                    for run_id, (log_base, soup_file, graph_file) in run_files.items()
+                }
+
+                for future in as_completed(futures):
+                    run_id = futures[future]
+                    record_result(run_id, *future.result())
+
+        # Let any in-flight plot/network jobs finish before the summary
+        plot_pool.shutdown(wait=True)
+
+        # Summaries list runs in id order regardless of completion order
+        results = [run_results[run_id] for run_id in sorted(run_results)]
+
     finally:
         os.chdir(original_cwd)
+        if merged_is_temp and merged_soup_path.exists():
+            try:
+                merged_soup_path.unlink()
+            except OSError:
+                pass  # Best effort cleanup
     
     # Record end time
     end_time = datetime.now()
@@ -642,7 +924,7 @@ Examples:
     save_experiment_summary(
         output_dir=output_dir,
         args=args,
-        input_files=input_files,
+        input_files_strs=input_files_strs,
         results=results,
         successful_runs=successful_runs,
         failed_runs=failed_runs,
@@ -659,17 +941,20 @@ Examples:
     print(f"Output directory: {output_dir}")
     print()
     
-    # List generated files
+    # List generated files. scandir hands back DirEntry objects whose stat
+    # is cached from the directory read, so this is one syscall per file
+    # fewer than iterdir + Path.stat.
     print("Generated files:")
-    for item in sorted(output_dir.iterdir()):
-        size = item.stat().st_size
-        if size > 1024 * 1024:
-            size_str = f"{size / (1024*1024):.1f}MB"
-        elif size > 1024:
-            size_str = f"{size / 1024:.1f}KB"
-        else:
-            size_str = f"{size}B"
-        print(f"  {item.name:40} {size_str:>10}")
+    with os.scandir(output_dir) as entries:
+        for entry in sorted(entries, key=lambda e: e.name):
+            size = entry.stat().st_size
+            if size > 1024 * 1024:
+                size_str = f"{size / (1024*1024):.1f}MB"
+            elif size > 1024:
+                size_str = f"{size / 1024:.1f}KB"
+            else:
+                size_str = f"{size}B"
+            print(f"  {entry.name:40} {size_str:>10}")
     
     print("\n" + "=" * 70)
     print("🎉 Experiment suite complete!")
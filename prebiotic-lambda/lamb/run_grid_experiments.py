@@ -19,11 +19,100 @@ import subprocess
 import sys
 import os
 import json
+import re
+import shlex
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Any
 import argparse
 
+# orjson serializes in C and is 3-10x faster than stdlib json on the large
+# per-run stats lists; stdlib remains the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# How many trailing stdout lines to keep per run. The stats block lamb_grid
+# prints after "=== SIMULATION COMPLETE ===" is a few dozen lines, so a
+# bounded tail is plenty while keeping memory flat for 500k-iteration runs.
+_OUTPUT_TAIL_LINES = 10_000
+
+_COMPLETE_MARKER = '=== SIMULATION COMPLETE ==='
+
+# pyplot keeps process-global state, so in-process renders from the plot
+# worker threads are serialized through this lock.
+_PLOT_RENDER_LOCK = threading.Lock()
+
+# REPL command script for one batch run; formatted once per run instead of
+# rebuilding the multi-line literal inline.
+_GRID_CMD = ":grid {w} {h} {d} {i} {dp} {ms} {lf}\n:quit\n"
+
+# Refresh experiment_summary.json after this many completed runs, so a crash
+# late in a long batch loses at most one checkpoint's worth of stats.
+_CHECKPOINT_EVERY = 10
+
+# Substrings that mark per-run summary lines worth echoing to the console
+_SUMMARY_PREFIXES = ('Total steps:', 'Reactions:', 'Movements:', 'Age deaths:',
+                     'Cosmic rays:', 'Population:', 'Unique:', 'Dominant:')
+
+# One compiled pattern classifies a stats line in a single pass; the per-key
+# value parsing is dispatched through _STAT_PARSERS below.
+_STATS_RE = re.compile(
+    r'^\s*(?P<key>Total steps|Reactions|Movements|Age deaths|Cosmic rays|'
+    r'Population|Unique|Dominant):\s*(?P<val>.*)$'
+)
+
+
+def _store_int_stat(stat_key: str):
+    """Build a parser that stores the value as a plain integer."""
+    def parse(value: str, stats: dict[str, Any]) -> None:
+        stats[stat_key] = int(value.strip())
+    return parse
+
+
+def _parse_reactions(value: str, stats: dict[str, Any]) -> None:
+    # Format: "X successful, Y diverged". partition stops at the first
+    # separator and never allocates a list of parts.
+    success, sep, rest = value.partition('successful')
+    if sep:
+        stats['reactions_success'] = int(success.strip())
+    diverged = rest.partition(',')[2].partition('diverged')[0]
+    if diverged:
+        stats['reactions_diverged'] = int(diverged.strip())
+
+
+def _parse_cosmic_rays(value: str, stats: dict[str, Any]) -> None:
+    # Format: "X spawns"
+    stats['cosmic_spawns'] = int(value.partition('spawns')[0].strip())
+
+
+def _parse_unique(value: str, stats: dict[str, Any]) -> None:
+    # Format: "N (X.XX% diversity)"
+    stats['final_unique_species'] = int(value.partition(' ')[0])
+
+
+def _parse_dominant(value: str, stats: dict[str, Any]) -> None:
+    # Format: "expr (count, X.XX%)"
+    expr, sep, _ = value.partition('(')
+    if sep:
+        stats['final_dominant_expr'] = expr.strip()
+
+
+_STAT_PARSERS = {
+    'Total steps': _store_int_stat('total_steps'),
+    'Reactions': _parse_reactions,
+    'Movements': _store_int_stat('movements'),
+    'Age deaths': _store_int_stat('deaths_age'),
+    'Cosmic rays': _parse_cosmic_rays,
+    'Population': _store_int_stat('final_population'),
+    'Unique': _parse_unique,
+    'Dominant': _parse_dominant,
+}
+
 
 def run_grid_simulation(
     lamb_path: Path,
@@ -36,10 +125,14 @@ def run_grid_simulation(
     log_file: str,
     run_id: int,
     total_runs: int,
+    cwd: Optional[Path] = None,
+    timeout: Optional[float] = None,
+    quiet: bool = False,
+    cmds_path: Optional[Path] = None,
 ) -> tuple[bool, str]:
     """
     Run a single LAMB grid simulation.
-    
+
     Args:
         lamb_path: Path to the lamb executable
         width: Grid width
@@ -51,63 +144,104 @@ def run_grid_simulation(
         log_file: Base name for the log file (without .csv)
         run_id: Current run number (for display)
         total_runs: Total number of runs (for display)
-    
+        cwd: Working directory for the child process (output files land here)
+        timeout: Kill the run after this many seconds (None = no limit)
+        quiet: Suppress per-run console output (failures still print)
+        cmds_path: Pre-written command script to feed the child; written
+            here when not supplied
+
     Returns:
         Tuple of (success: bool, output: str)
     """
-    # Build the commands to send to lamb
-    commands = f"""
-:grid {width} {height} {density} {iterations} {depth} {max_steps} {log_file}
-:quit
-"""
-    
-    print(f"\n{'='*60}")
-    print(f"🧪 Run {run_id}/{total_runs}")
-    print(f"{'='*60}")
-    print(f"Grid:       {width}x{height} ({width*height} cells)")
-    print(f"Density:    {density}% (~{(width*height*density)//100} creatures)")
-    print(f"Iterations: {iterations:,}")
-    print(f"Depth:      {depth}")
-    print(f"Max steps:  {max_steps}")
-    print(f"Log file:   {log_file}.csv")
-    print("-" * 60)
+
+    if not quiet:
+        cells = width * height
+        initial_pop = (cells * density) // 100
+
+        print(f"\n{'='*60}")
+        print(f"🧪 Run {run_id}/{total_runs}")
+        print(f"{'='*60}")
+        print(f"Grid:       {width}x{height} ({cells} cells)")
+        print(f"Density:    {density}% (~{initial_pop} creatures)")
+        print(f"Iterations: {iterations:,}")
+        print(f"Depth:      {depth}")
+        print(f"Max steps:  {max_steps}")
+        print(f"Log file:   {log_file}.csv")
+        print("-" * 60)
     
     try:
-        result = subprocess.run(
-            [str(lamb_path)],
-            input=commands,
-            capture_output=True,
-            text=True,
-            timeout=None  # Long simulations may take a while
-        )
-        
+        # lamb_grid has no command-file flag; its REPL only reads stdin. But
+        # redirecting a pre-written command file as stdin still drops the
+        # pipe: the kernel serves the script from page cache and the parent
+        # never blocks feeding the child. The file also documents the run.
+        if cmds_path is None:
+            cmds_path = (cwd if cwd is not None else Path.cwd()) / f'run_{run_id:02d}.cmds'
+            cmds_path.write_text(
+                _GRID_CMD.format(w=width, h=height, d=density, i=iterations,
+                                 dp=depth, ms=max_steps, lf=log_file))
+
+        # Stream stdout line by line instead of letting subprocess.run buffer
+        # the whole transcript: a 500k-iteration run can emit a lot of output,
+        # and only the trailing stats block matters. A bounded deque keeps
+        # peak memory flat, and summary lines are echoed as they arrive.
+        with open(cmds_path) as cmds_fh:
+            proc = subprocess.Popen(
+                [str(lamb_path)],
+                stdin=cmds_fh,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+                cwd=cwd,  # os.chdir is process-global and would race between workers
+            )
+        assert proc.stdout is not None
+
+        # The streaming read below has no built-in deadline, so a hung run
+        # is reaped by a watchdog timer; one stuck child then fails fast
+        # instead of starving the whole batch.
+        timed_out = False
+        watchdog = None
+        if timeout is not None:
+            def _kill_stuck_run():
+                nonlocal timed_out
+                timed_out = True
+                proc.kill()
+            watchdog = threading.Timer(timeout, _kill_stuck_run)
+            watchdog.start()
+
+        tail: deque[str] = deque(maxlen=_OUTPUT_TAIL_LINES)
+        completed = False
+        try:
+            for line in proc.stdout:
+                tail.append(line)
+                stripped = line.strip()
+                if stripped == _COMPLETE_MARKER:
+                    completed = True
+                elif completed and not quiet and stripped.startswith(_SUMMARY_PREFIXES):
+                    print(f"  {stripped}")
+
+            stderr = proc.stderr.read() if proc.stderr else ''
+            returncode = proc.wait()
+        finally:
+            if watchdog is not None:
+                watchdog.cancel()
+        output = ''.join(tail)
+
+        if timed_out:
+            print(f"❌ Run {run_id} timed out after {timeout:.0f}s!")
+            return False, "Timeout"
+
         # Check for errors
-        if result.returncode != 0:
-            print(f"❌ Run failed with exit code {result.returncode}")
-            print(f"stderr: {result.stderr}")
-            return False, result.stdout + result.stderr
-        
-        output = result.stdout
-        
-        # Print summary from output
-        if "=== SIMULATION COMPLETE ===" in output:
-            for line in output.split('\n'):
-                if 'Total steps:' in line or \
-                   'Reactions:' in line or \
-                   'Movements:' in line or \
-                   'Age deaths:' in line or \
-                   'Cosmic rays:' in line or \
-                   'Population:' in line or \
-                   'Unique:' in line or \
-                   'Dominant:' in line:
-                    print(f"  {line.strip()}")
+        if returncode != 0:
+            print(f"❌ Run failed with exit code {returncode}")
+            print(f"stderr: {stderr}")
+            return False, output + stderr
+
+        if completed and not quiet:
             print(f"✅ Run {run_id} completed successfully!")
-        
+
         return True, output
-        
-    except subprocess.TimeoutExpired:
-        print(f"❌ Run {run_id} timed out!")
-        return False, "Timeout"
+
     except Exception as e:
         print(f"❌ Run {run_id} failed with error: {e}")
         return False, str(e)
@@ -117,16 +251,38 @@ def generate_plots(
     log_file: Path,
     plot_script: Path,
     python_path: Path,
-    run_id: int
+    run_id: int,
+    plot_module=None,
+    quiet: bool = False,
 ) -> bool:
-    """Generate plots for a grid simulation log file."""
+    """Generate plots for a grid simulation log file.
+
+    When plot_module (an imported plot_grid_simulation) is given, rendering
+    happens in-process, which skips the ~0.5s interpreter + matplotlib
+    cold-start that a subprocess pays per log file. Otherwise the plot
+    script is run as a subprocess.
+    """
     if not log_file.exists():
         print(f"⚠️  Log file not found: {log_file}")
         return False
-    
+
     detailed_plot = log_file.with_suffix('.png')
     combined_plot = log_file.with_name(log_file.stem + '_combined.png')
-    
+
+    if plot_module is not None:
+        try:
+            with _PLOT_RENDER_LOCK:
+                plot_module.render_from_csv(log_file, output_path=detailed_plot,
+                                            combined_path=combined_plot, show=False)
+            if not quiet:
+                print(f"📊 Plots generated: {detailed_plot.name}, {combined_plot.name}")
+            return True
+        # load_log exits on unreadable logs; treat that as a failed plot,
+        # not a dead runner
+        except (Exception, SystemExit) as e:
+            print(f"⚠️  Plot generation error: {e}")
+            return False
+
     try:
         result = subprocess.run(
             [
@@ -139,11 +295,15 @@ def generate_plots(
                 '--no-show'
             ],
             capture_output=True,
-            text=True
+            text=True,
+            # Paths are absolute, but pin cwd anyway so the plot script never
+            # depends on where the runner happens to be executing
+            cwd=log_file.parent,
         )
         
         if result.returncode == 0:
-            print(f"📊 Plots generated: {detailed_plot.name}, {combined_plot.name}")
+            if not quiet:
+                print(f"📊 Plots generated: {detailed_plot.name}, {combined_plot.name}")
             return True
         else:
             print(f"⚠️  Plot generation failed: {result.stderr}")
@@ -191,13 +351,16 @@ def launch_view(
         '--max-mass', str(max_mass),
     ]
     
+    cells = width * height
+    initial_pop = (cells * density) // 100
+
     print("\n" + "=" * 70)
     print("🖥️  LAUNCHING LAMB VIEW - Interactive Visualizer")
     print("=" * 70)
-    print(f"Grid:        {width}x{height} ({width * height} cells)")
+    print(f"Grid:        {width}x{height} ({cells} cells)")
     print(f"Cell size:   {cell_size} px")
     print(f"Window:      {width * cell_size}x{height * cell_size + 60} px")
-    print(f"Density:     {density}% (~{(width * height * density) // 100} creatures)")
+    print(f"Density:     {density}% (~{initial_pop} creatures)")
     print(f"Depth:       {depth}")
     print(f"Eval steps:  {eval_steps}")
     print(f"Max mass:    {max_mass}")
@@ -218,70 +381,55 @@ def launch_view(
 
 
 def extract_stats_from_output(output: str) -> dict[str, Any]:
-    """Extract simulation statistics from lamb output."""
+    """Extract simulation statistics from lamb output.
+
+    Each line is classified by a single compiled regex match and handed to a
+    per-key parser, instead of running every substring check and re-splitting
+    the line for each candidate stat. Later occurrences overwrite earlier
+    ones, so the final stats block wins.
+    """
     stats: dict[str, Any] = {}
-    
-    for line in output.split('\n'):
-        line = line.strip()
-        if 'Total steps:' in line:
-            try:
-                stats['total_steps'] = int(line.split(':')[1].strip())
-            except (ValueError, IndexError):
-                pass
-        elif 'Reactions:' in line:
-            try:
-                # Format: "Reactions: X successful, Y diverged"
-                parts = line.split(':')[1].strip()
-                if 'successful' in parts:
-                    stats['reactions_success'] = int(parts.split('successful')[0].strip())
-                if 'diverged' in parts:
-                    div_part = parts.split(',')[1].strip()
-                    stats['reactions_diverged'] = int(div_part.split('diverged')[0].strip())
-            except (ValueError, IndexError):
-                pass
-        elif 'Movements:' in line:
-            try:
-                stats['movements'] = int(line.split(':')[1].strip())
-            except (ValueError, IndexError):
-                pass
-        elif 'Age deaths:' in line:
-            try:
-                stats['deaths_age'] = int(line.split(':')[1].strip())
-            except (ValueError, IndexError):
-                pass
-        elif 'Cosmic rays:' in line:
-            try:
-                # Format: "Cosmic rays: X spawns"
-                parts = line.split(':')[1].strip()
-                stats['cosmic_spawns'] = int(parts.split('spawns')[0].strip())
-            except (ValueError, IndexError):
-                pass
-        elif 'Population:' in line and 'FINAL' not in line:
-            try:
-                stats['final_population'] = int(line.split(':')[1].strip())
-            except (ValueError, IndexError):
-                pass
-        elif 'Unique:' in line:
-            try:
-                parts = line.split()
-                for i, p in enumerate(parts):
-                    if p == 'Unique:':
-                        stats['final_unique_species'] = int(parts[i+1])
-                        break
-            except (ValueError, IndexError):
-                pass
-        elif 'Dominant:' in line:
-            try:
-                parts = line.split('Dominant:')[1].strip()
-                if '(' in parts:
-                    expr = parts.split('(')[0].strip()
-                    stats['final_dominant_expr'] = expr
-            except (ValueError, IndexError):
-                pass
-    
+
+    # Everything we extract is printed after the completion marker; skip
+    # straight to the last occurrence so per-step log lines are never parsed.
+    idx = output.rfind(_COMPLETE_MARKER)
+    tail = output[idx:] if idx >= 0 else output
+
+    for line in tail.split('\n'):
+        m = _STATS_RE.match(line)
+        if not m:
+            continue
+        try:
+            _STAT_PARSERS[m.group('key')](m.group('val'), stats)
+        except (ValueError, IndexError):
+            # Lines like "Population: 109 cells (10% density)" from seeding
+            # share a key with the final stats block; skip the ones whose
+            # value doesn't parse.
+            pass
+
     return stats
 
 
+def _write_results_checkpoint(output_dir: Path, results: list[dict[str, Any]]) -> None:
+    """Atomically refresh experiment_summary.json with the results so far.
+
+    Serializes to a temp file and os.replace()s it over the summary, so a
+    reader (or a crash) never sees a half-written document. The full summary
+    written at the end overwrites the last checkpoint.
+    """
+    payload = {
+        'checkpoint': True,
+        'completed_runs': len(results),
+        'runs': results,
+    }
+    tmp_path = output_dir / '.summary.json.tmp'
+    if orjson is not None:
+        tmp_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        tmp_path.write_text(json.dumps(payload, indent=2))
+    os.replace(tmp_path, output_dir / 'experiment_summary.json')
+
+
 def save_experiment_summary(
     output_dir: Path,
     args: argparse.Namespace,
@@ -292,6 +440,9 @@ def save_experiment_summary(
     end_time: datetime
 ) -> None:
     """Save experiment summary to JSON and text files."""
+    cells = args.width * args.height
+    initial_pop = (cells * args.density) // 100
+
     # Reconstruct CLI command
     cli_parts = ['python', 'run_grid_experiments.py']
     cli_parts.extend([
@@ -313,24 +464,34 @@ def save_experiment_summary(
     if args.lamb_view != './lamb_view':
         cli_parts.extend(['--lamb-view', args.lamb_view])
     
-    cli_command = ' '.join(cli_parts)
-    
+    # shlex.join quotes parts containing spaces, so the reproduction command
+    # stays copy-pasteable even with exotic output paths
+    cli_command = shlex.join(cli_parts)
+
+    # Format timestamps and duration once; both the JSON and text reports
+    # reuse them below
+    start_iso = start_time.isoformat()
+    end_iso = end_time.isoformat()
+    start_s = start_time.strftime('%Y-%m-%d %H:%M:%S')
+    end_s = end_time.strftime('%Y-%m-%d %H:%M:%S')
+    duration_s = (end_time - start_time).total_seconds()
+
     summary = {
         'experiment': {
             'type': '2D_spatial_grid',
             'cli_command': cli_command,
-            'start_time': start_time.isoformat(),
-            'end_time': end_time.isoformat(),
-            'duration_seconds': (end_time - start_time).total_seconds(),
+            'start_time': start_iso,
+            'end_time': end_iso,
+            'duration_seconds': duration_s,
             'output_directory': str(output_dir),
         },
         'parameters': {
             'runs': args.runs,
             'grid_width': args.width,
             'grid_height': args.height,
-            'grid_cells': args.width * args.height,
+            'grid_cells': cells,
             'density_percent': args.density,
-            'initial_population': (args.width * args.height * args.density) // 100,
+            'initial_population': initial_pop,
             'iterations': args.iterations,
             'depth': args.depth,
             'max_steps': args.max_steps,
@@ -347,70 +508,77 @@ def save_experiment_summary(
     
     # Save JSON
     json_path = output_dir / 'experiment_summary.json'
-    with open(json_path, 'w') as f:
-        json.dump(summary, f, indent=2)
+    if orjson is not None:
+        json_path.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+    else:
+        with open(json_path, 'w') as f:
+            json.dump(summary, f, indent=2)
     
-    # Save human-readable text
+    # Save human-readable text. Assemble the report in a list and write it
+    # once: one syscall-backed write instead of dozens of small f.write calls
+    # (plus several per run) through buffered I/O.
     txt_path = output_dir / 'experiment_summary.txt'
-    with open(txt_path, 'w') as f:
-        f.write("=" * 70 + "\n")
-        f.write("LAMB 2D SPATIAL GRID EXPERIMENT SUMMARY\n")
-        f.write("=" * 70 + "\n\n")
-        
-        f.write("COMMAND TO REPRODUCE:\n")
-        f.write(f"  {cli_command}\n\n")
-        
-        f.write("TIMING:\n")
-        f.write(f"  Started:  {start_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"  Finished: {end_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"  Duration: {(end_time - start_time).total_seconds():.1f} seconds\n\n")
-        
-        f.write("PARAMETERS:\n")
-        f.write(f"  Runs:             {args.runs}\n")
-        f.write(f"  Grid size:        {args.width}x{args.height} ({args.width * args.height} cells)\n")
-        f.write(f"  Density:          {args.density}%\n")
-        f.write(f"  Initial pop:      {(args.width * args.height * args.density) // 100}\n")
-        f.write(f"  Iterations:       {args.iterations:,}\n")
-        f.write(f"  Depth:            {args.depth}\n")
-        f.write(f"  Max steps:        {args.max_steps}\n")
-        f.write(f"  Max mass:         {args.max_mass}\n")
-        f.write(f"  Plots:            {'Yes' if not args.no_plots else 'No'}\n\n")
-        
-        f.write("RESULTS:\n")
-        f.write(f"  Successful: {successful_runs}/{args.runs}\n")
-        f.write(f"  Failed:     {failed_runs}/{args.runs}\n\n")
-        
-        f.write("RUN DETAILS:\n")
-        f.write("-" * 70 + "\n")
-        for run in results:
-            run_id = run.get('run_id', '?')
-            success = run.get('success', False)
-            f.write(f"\nRun {run_id}: {'SUCCESS' if success else 'FAILED'}\n")
-            if success:
-                f.write(f"  Log:  {run.get('log_file', 'N/A')}\n")
-                f.write(f"  Soup: {run.get('soup_file', 'N/A')}\n")
-                if 'stats' in run:
-                    stats = run['stats']
-                    if 'total_steps' in stats:
-                        f.write(f"  Steps: {stats['total_steps']:,}\n")
-                    if 'reactions_success' in stats:
-                        f.write(f"  Reactions: {stats['reactions_success']:,} successful")
-                        if 'reactions_diverged' in stats:
-                            f.write(f", {stats['reactions_diverged']:,} diverged")
-                        f.write("\n")
-                    if 'deaths_age' in stats:
-                        f.write(f"  Age deaths: {stats['deaths_age']:,}\n")
-                    if 'cosmic_spawns' in stats:
-                        f.write(f"  Cosmic spawns: {stats['cosmic_spawns']:,}\n")
-                    if 'final_unique_species' in stats:
-                        f.write(f"  Final unique species: {stats['final_unique_species']}\n")
-                    if 'final_dominant_expr' in stats:
-                        f.write(f"  Dominant: {stats['final_dominant_expr']}\n")
-        
-        f.write("\n" + "=" * 70 + "\n")
-        f.write(f"Output directory: {output_dir}\n")
-        f.write("=" * 70 + "\n")
-    
+    out: list[str] = []
+    out.append("=" * 70 + "\n")
+    out.append("LAMB 2D SPATIAL GRID EXPERIMENT SUMMARY\n")
+    out.append("=" * 70 + "\n\n")
+
+    out.append("COMMAND TO REPRODUCE:\n")
+    out.append(f"  {cli_command}\n\n")
+
+    out.append("TIMING:\n")
+    out.append(f"  Started:  {start_s}\n")
+    out.append(f"  Finished: {end_s}\n")
+    out.append(f"  Duration: {duration_s:.1f} seconds\n\n")
+
+    out.append("PARAMETERS:\n")
+    out.append(f"  Runs:             {args.runs}\n")
+    out.append(f"  Grid size:        {args.width}x{args.height} ({cells} cells)\n")
+    out.append(f"  Density:          {args.density}%\n")
+    out.append(f"  Initial pop:      {initial_pop}\n")
+    out.append(f"  Iterations:       {args.iterations:,}\n")
+    out.append(f"  Depth:            {args.depth}\n")
+    out.append(f"  Max steps:        {args.max_steps}\n")
+    out.append(f"  Max mass:         {args.max_mass}\n")
+    out.append(f"  Plots:            {'Yes' if not args.no_plots else 'No'}\n\n")
+
+    out.append("RESULTS:\n")
+    out.append(f"  Successful: {successful_runs}/{args.runs}\n")
+    out.append(f"  Failed:     {failed_runs}/{args.runs}\n\n")
+
+    out.append("RUN DETAILS:\n")
+    out.append("-" * 70 + "\n")
+    for run in results:
+        run_id = run.get('run_id', '?')
+        success = run.get('success', False)
+        out.append(f"\nRun {run_id}: {'SUCCESS' if success else 'FAILED'}\n")
+        if success:
+            out.append(f"  Log:  {run.get('log_file', 'N/A')}\n")
+            out.append(f"  Soup: {run.get('soup_file', 'N/A')}\n")
+            if 'stats' in run:
+                stats = run['stats']
+                if 'total_steps' in stats:
+                    out.append(f"  Steps: {stats['total_steps']:,}\n")
+                if 'reactions_success' in stats:
+                    out.append(f"  Reactions: {stats['reactions_success']:,} successful")
+                    if 'reactions_diverged' in stats:
+                        out.append(f", {stats['reactions_diverged']:,} diverged")
+                    out.append("\n")
+                if 'deaths_age' in stats:
+                    out.append(f"  Age deaths: {stats['deaths_age']:,}\n")
+                if 'cosmic_spawns' in stats:
+                    out.append(f"  Cosmic spawns: {stats['cosmic_spawns']:,}\n")
+                if 'final_unique_species' in stats:
+                    out.append(f"  Final unique species: {stats['final_unique_species']}\n")
+                if 'final_dominant_expr' in stats:
+                    out.append(f"  Dominant: {stats['final_dominant_expr']}\n")
+
+    out.append("\n" + "=" * 70 + "\n")
+    out.append(f"Output directory: {output_dir}\n")
+    out.append("=" * 70 + "\n")
+
+    txt_path.write_text(''.join(out))
+
     print(f"📄 Summary saved: experiment_summary.json, experiment_summary.txt")
 
 
@@ -469,6 +637,12 @@ Examples:
                        help='Number of simulation steps for batch mode (default: 500000)')
     parser.add_argument('--output-dir', type=str, default=None,
                        help='Output directory for batch mode (default: ./grid_experiments_TIMESTAMP)')
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                       help='Number of simulations to run concurrently (default: min(runs, CPU count))')
+    parser.add_argument('--per-run-timeout', type=float, default=None,
+                       help='Kill a single run after this many seconds (default: no limit)')
+    parser.add_argument('--quiet', '-q', action='store_true',
+                       help='Suppress per-run output and the final file listing')
     parser.add_argument('--no-plots', action='store_true',
                        help='Skip plot generation in batch mode')
     
@@ -490,7 +664,7 @@ Examples:
     
     # Handle view mode
     if args.view:
-        lamb_view_path = Path(args.lamb_view).resolve() if not Path(args.lamb_view).is_absolute() else Path(args.lamb_view)
+        lamb_view_path = Path(args.lamb_view).resolve()
         
         if not lamb_view_path.exists():
             lamb_view_path = script_dir / 'lamb_view'
@@ -522,7 +696,7 @@ Examples:
     # Record start time
     start_time = datetime.now()
     
-    lamb_path = Path(args.lamb).resolve() if not Path(args.lamb).is_absolute() else Path(args.lamb)
+    lamb_path = Path(args.lamb).resolve()
     
     if not lamb_path.exists():
         lamb_path = script_dir / 'lamb_grid'
@@ -536,10 +710,23 @@ Examples:
     # Fall back to regular plot script if grid-specific one doesn't exist
     if not plot_script.exists():
         plot_script = script_dir / 'plot_simulation.py'
-    
+
     python_path = script_dir / '.venv' / 'bin' / 'python'
     if not python_path.exists():
         python_path = Path(sys.executable)
+
+    # Import the grid plot module once so every log renders in this process
+    # instead of paying an interpreter + matplotlib start per run. The env
+    # var forces the headless backend before the module touches pyplot.
+    plot_module = None
+    if not args.no_plots and plot_script.name == 'plot_grid_simulation.py':
+        os.environ.setdefault('MPLBACKEND', 'Agg')
+        if str(script_dir) not in sys.path:
+            sys.path.insert(0, str(script_dir))
+        try:
+            import plot_grid_simulation as plot_module
+        except ImportError:
+            plot_module = None  # fall back to the subprocess path
     
     # Create output directory
     if args.output_dir:
@@ -551,35 +738,53 @@ Examples:
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Print experiment header
+    cells = args.width * args.height
+    initial_pop = (cells * args.density) // 100
+
     print("\n" + "=" * 70)
     print("🌐 LAMB 2D SPATIAL GRID EXPERIMENT SUITE")
     print("=" * 70)
-    print(f"Grid size:   {args.width}x{args.height} ({args.width * args.height} cells)")
-    print(f"Density:     {args.density}% (~{(args.width * args.height * args.density) // 100} creatures)")
+    print(f"Grid size:   {args.width}x{args.height} ({cells} cells)")
+    print(f"Density:     {args.density}% (~{initial_pop} creatures)")
     print(f"Runs:        {args.runs}")
     print(f"Iterations:  {args.iterations:,}")
     print(f"Depth:       {args.depth}")
     print(f"Max steps:   {args.max_steps}")
+    jobs = args.jobs if args.jobs else min(args.runs, os.cpu_count() or 1)
+
+    print(f"Jobs:        {jobs}")
     print(f"Output dir:  {output_dir}")
     print(f"Lamb path:   {lamb_path}")
     print("=" * 70)
-    
+
     # Track results
     successful_runs = 0
     failed_runs = 0
-    results: list[dict[str, Any]] = []
-    
-    # Change to output directory
-    original_cwd = os.getcwd()
-    os.chdir(output_dir)
-    
-    try:
+    run_results: dict[int, dict[str, Any]] = {}
+    pending_plots: list[tuple[Path, int]] = []
+
+    # Each worker just blocks on its child process, so threads are enough to
+    # keep `jobs` simulations in flight. The children write into output_dir
+    # via cwd= rather than a process-global os.chdir.
+    # Pre-write every run's command script before the pool spins up, so the
+    # parallel region issues no file creations of its own beyond the child
+    # outputs (lamb_grid offers no fd-passing or I/O-buffer knobs to tune).
+    cmds_paths = {}
+    for run_id in range(1, args.runs + 1):
+        log_base = f'run_{run_id:02d}_log'
+        cmds_path = output_dir / f'run_{run_id:02d}.cmds'
+        cmds_path.write_text(
+            _GRID_CMD.format(w=args.width, h=args.height, d=args.density,
+                             i=args.iterations, dp=args.depth,
+                             ms=args.max_steps, lf=log_base))
+        cmds_paths[run_id] = cmds_path
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {}
         for run_id in range(1, args.runs + 1):
-            # Generate unique filenames
             log_base = f'run_{run_id:02d}_log'
-            soup_file = f'{log_base}.lamb'
-            
-            success, output = run_grid_simulation(
+            futures[pool.submit(
+                run_grid_simulation,
                 lamb_path=lamb_path,
                 width=args.width,
                 height=args.height,
@@ -590,33 +795,61 @@ Examples:
                 log_file=log_base,
                 run_id=run_id,
                 total_runs=args.runs,
-            )
-            
+                cwd=output_dir,
+                timeout=args.per_run_timeout,
+                quiet=args.quiet,
+                cmds_path=cmds_paths[run_id],
+            )] = (run_id, log_base)
+
+        completed_runs = 0
+        for future in as_completed(futures):
+            run_id, log_base = futures[future]
+            success, output = future.result()
+
             if success:
                 successful_runs += 1
                 stats = extract_stats_from_output(output)
-                results.append({
+                run_results[run_id] = {
                     'run_id': run_id,
                     'log_file': f'{log_base}.csv',
-                    'soup_file': soup_file,
+                    'soup_file': f'{log_base}.lamb',
                     'success': True,
                     'stats': stats
-                })
-                
-                # Generate plots if requested
+                }
+
+                # Queue plot generation; it runs batched after the sim loop
                 if not args.no_plots and plot_script.exists():
-                    log_path = Path(f'{log_base}.csv')
-                    generate_plots(log_path, plot_script, python_path, run_id)
+                    pending_plots.append((output_dir / f'{log_base}.csv', run_id))
             else:
                 failed_runs += 1
-                results.append({
+                run_results[run_id] = {
                     'run_id': run_id,
                     'success': False
-                })
-    
-    finally:
-        os.chdir(original_cwd)
-    
+                }
+
+            completed_runs += 1
+            if completed_runs % _CHECKPOINT_EVERY == 0:
+                _write_results_checkpoint(
+                    output_dir,
+                    [run_results[rid] for rid in sorted(run_results)])
+
+    results = [run_results[run_id] for run_id in sorted(run_results)]
+
+    # Generate all plots at once. Each invocation is its own interpreter, so
+    # launching them from threads overlaps the matplotlib startup cost that
+    # dominates small logs.
+    if pending_plots:
+        with ThreadPoolExecutor(
+            max_workers=min(len(pending_plots), os.cpu_count() or 1)
+        ) as plot_pool:
+            plot_futures = [
+                plot_pool.submit(generate_plots, log_path, plot_script,
+                                 python_path, run_id, plot_module, args.quiet)
+                for log_path, run_id in pending_plots
+            ]
+            for plot_future in plot_futures:
+                plot_future.result()
+
     # Record end time
     end_time = datetime.now()
     
@@ -640,17 +873,21 @@ Examples:
     print(f"Output directory: {output_dir}")
     print()
     
-    # List generated files
-    print("Generated files:")
-    for item in sorted(output_dir.iterdir()):
-        size = item.stat().st_size
-        if size > 1024 * 1024:
-            size_str = f"{size / (1024*1024):.1f}MB"
-        elif size > 1024:
-            size_str = f"{size / 1024:.1f}KB"
-        else:
-            size_str = f"{size}B"
-        print(f"  {item.name:40} {size_str:>10}")
+    # List generated files. scandir's DirEntry caches stat results from the
+    # directory read, so this avoids a second stat syscall per entry that
+    # iterdir() + Path.stat() would issue.
+    if not args.quiet:
+        print("Generated files:")
+        with os.scandir(output_dir) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                size = entry.stat().st_size
+                if size > 1024 * 1024:
+                    size_str = f"{size / (1024*1024):.1f}MB"
+                elif size > 1024:
+                    size_str = f"{size / 1024:.1f}KB"
+                else:
+                    size_str = f"{size}B"
+                print(f"  {entry.name:40} {size_str:>10}")
     
     print("\n" + "=" * 70)
     print("🎉 Experiment suite complete!")
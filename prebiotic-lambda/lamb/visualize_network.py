@@ -6,107 +6,241 @@ Visualizes the reaction network exported from the lamb interpreter's :export_gra
 Shows species as nodes and reactions as edges, with analysis of network closure.
 
 Usage:
-    python visualize_network.py network_data.json [output.png]
+    python visualize_network.py network_data.json [output.png] [--no-show]
 """
 
+import functools
+import hashlib
+import io
 import json
+import os
+import pickle
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+# Pick the headless backend before pyplot is imported: --no-show runs (and
+# boxes without a display) otherwise pay GUI backend initialization for
+# nothing.
+if '--no-show' in sys.argv or not os.environ.get('DISPLAY'):
+    import matplotlib
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import networkx as nx
+
+# orjson parses the exported networks several times faster than the stdlib
+# state machine; fall back silently when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 import numpy as np
+from scipy.sparse import csr_matrix
+
+# igraph's Fruchterman-Reingold layout is a C implementation, an order of
+# magnitude faster than networkx's for networks near the visualization limit
+try:
+    import igraph as ig
+except ImportError:
+    ig = None
 
 # Maximum number of species for full network visualization
 # Beyond this, the graph becomes unreadable and takes too long to compute
 MAX_SPECIES_FOR_VISUALIZATION = 150
 
+# Above this many edges, draw them without arrowheads: arrows force one
+# FancyArrowPatch per edge, while arrows=False batches every edge into a
+# single LineCollection (orders of magnitude faster on dense networks)
+MAX_EDGES_FOR_ARROWS = 50
+
+# Above this many nodes, skip per-node labels (one Text artist each) and
+# annotate only the most abundant species
+MAX_NODES_FOR_LABELS = 40
 
-def load_network(filepath: str) -> dict[str, Any]:
-    """Load the JSON network data."""
-    with open(filepath) as f:
-        return json.load(f)
+# Above this many edges, run force-directed layout only on the 2-core of
+# the graph and hang the peripheral nodes off their neighbors afterwards;
+# FR iteration cost grows with |V|^2 and the periphery barely moves it
+MAX_EDGES_FOR_FULL_LAYOUT = 500
 
+# Computed layouts are cached here keyed by the graph structure, so
+# re-visualizing the same JSON (common during parameter sweeps) skips the
+# force simulation entirely
+LAYOUT_CACHE_DIR = Path.home() / '.cache' / 'lamb_viz'
 
-def build_reaction_graph(data: dict[str, Any]) -> tuple[nx.DiGraph, nx.DiGraph, dict[int, str], dict[int, int]]:
+
+@dataclass(slots=True)
+class NetworkData:
+    """Preprocessed reaction network shared by every consumer.
+
+    A single pass over the parsed JSON produces the node lookups and the
+    flat link arrays; no downstream function re-scans the raw data.
+    """
+    ids: list[int]                # node IDs in file order
+    labels: dict[int, str]        # node ID -> lambda expression label
+    counts: dict[int, int]        # node ID -> population count
+    src: np.ndarray               # link source IDs (the applied function)
+    tgt: np.ndarray               # link target IDs (the argument)
+    res: np.ndarray               # link result IDs (-1 = leaks out)
+
+    @property
+    def num_species(self) -> int:
+        return len(self.ids)
+
+    @property
+    def num_reactions(self) -> int:
+        return len(self.src)
+
+
+def load_network(filepath: str) -> NetworkData:
+    """Load the JSON network data.
+
+    The per-link dicts are collapsed into three flat int32 arrays right at
+    load time — downstream only ever needs those three ints per link, so the
+    throwaway dict objects are freed immediately instead of living for the
+    whole run.
+
+    A pickle sidecar written next to the JSON skips the parse entirely on
+    re-runs; it is used only while newer than the JSON, and any failure to
+    read or write it falls back to parsing.
+    """
+    pkl_path = f"{filepath}.pkl"
+    try:
+        if os.path.getmtime(pkl_path) > os.path.getmtime(filepath):
+            with open(pkl_path, 'rb') as f:
+                cached = pickle.load(f)
+            if isinstance(cached, NetworkData):
+                return cached
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(filepath) as f:
+            data = json.load(f)
+
+    ids: list[int] = []
+    labels: dict[int, str] = {}
+    counts: dict[int, int] = {}
+    for node in data['nodes']:
+        nid = node['id']
+        ids.append(nid)
+        labels[nid] = node['label']
+        counts[nid] = node['count']
+
+    links = data['links']
+    count = len(links)
+    net = NetworkData(
+        ids=ids,
+        labels=labels,
+        counts=counts,
+        src=np.fromiter((l['source'] for l in links), dtype=np.int32, count=count),
+        tgt=np.fromiter((l['target'] for l in links), dtype=np.int32, count=count),
+        res=np.fromiter((l['result'] for l in links), dtype=np.int32, count=count),
+    )
+    # Release the L+N short-lived parse dicts before the (possibly large)
+    # pickle write below
+    del links, data
+
+    try:
+        with open(pkl_path, 'wb') as f:
+            pickle.dump(net, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+    return net
+
+
+def build_reaction_graph(net: NetworkData) -> tuple[nx.DiGraph, nx.DiGraph]:
     """
     Build directed graphs from the reaction data.
-    
+
     Returns:
         - closed_graph: Only reactions that stay within the population
         - full_graph: All reactions including those producing external results
-        - labels: Node ID -> lambda expression label
-        - counts: Node ID -> population count
     """
-    labels = {n['id']: n['label'] for n in data['nodes']}
-    counts = {n['id']: n['count'] for n in data['nodes']}
-    
     closed_graph = nx.DiGraph()
     full_graph = nx.DiGraph()
-    
-    # Add all nodes
-    for node in data['nodes']:
-        closed_graph.add_node(node['id'])
-        full_graph.add_node(node['id'])
-    
-    # Process reactions: A(B) -> C
-    # We represent this as edges from both A and B to C
-    for link in data['links']:
-        src = link['source']  # The "function" being applied
-        tgt = link['target']  # The "argument"
-        res = link['result']  # The product
-        
-        # Store the full reaction info as edge data
-        full_graph.add_edge(src, tgt, result=res, closed=(res != -1))
-        
-        if res != -1:
-            closed_graph.add_edge(src, tgt, result=res)
-    
-    return closed_graph, full_graph, labels, counts
 
+    # Bulk-insert nodes and edges: add_nodes_from/add_edges_from go through
+    # one NetworkX call instead of paying per-call bookkeeping per element.
+    closed_graph.add_nodes_from(net.ids)
+    full_graph.add_nodes_from(net.ids)
+
+    # Process reactions: A(B) -> C, stored as source -> target edges with
+    # the product kept as edge data
+    full_edges = [(int(s), int(t), {'result': int(r), 'closed': r != -1})
+                  for s, t, r in zip(net.src, net.tgt, net.res)]
+    full_graph.add_edges_from(full_edges)
+    closed_graph.add_edges_from(e for e in full_edges if e[2]['closed'])
+
+    return closed_graph, full_graph
+
+
+def _reaction_matrix(net: NetworkData) -> np.ndarray:
+    """Build the dense (N, N) reaction matrix in one advanced-indexing pass.
 
-def analyze_network(data: dict[str, Any], labels: dict[int, str]) -> dict[str, Any]:
-    """Analyze the reaction network for interesting properties."""
-    total_reactions = len(data['links'])
-    closed_reactions = sum(1 for link in data['links'] if link['result'] != -1)
+    Cells hold the result ID, or -1 where no product stays in the
+    population. Node IDs from :export_graph are sequential, so they index
+    the matrix directly.
+    """
+    n = net.num_species
+    matrix = np.full((n, n), -1, dtype=np.int32)
+    matrix[net.src, net.tgt] = net.res
+    return matrix
+
+
+def analyze_network(net: NetworkData) -> dict[str, Any]:
+    """Analyze the reaction network for interesting properties.
+
+    The per-node properties are row-wise reductions over the dense reaction
+    matrix instead of rescanning the link list per node, which turned O(N*L)
+    on large networks — and this runs even when the graph itself is too
+    large to draw.
+    """
+    src = net.src
+    tgt = net.tgt
+    res = net.res
+    total_reactions = len(src)
+
+    closed = res != -1
+    closed_reactions = int(closed.sum())
     open_reactions = total_reactions - closed_reactions
-    
-    # Find which reactions "leak" out of the network
-    leaks = [(link['source'], link['target']) for link in data['links'] if link['result'] == -1]
-    
-    # Build a product graph: edges point from (source, target) pair to result
-    # Analyze which nodes are "productive" (can create other nodes)
-    producers: dict[int, set[int]] = {n['id']: set() for n in data['nodes']}
-    for link in data['links']:
-        if link['result'] != -1:
-            producers[link['source']].add(link['result'])
-    
-    # Find "universal" nodes that produce the same result regardless of argument
-    universal_nodes: dict[int, int] = {}
-    for node in data['nodes']:
-        nid = node['id']
-        results_as_function = set()
-        for link in data['links']:
-            if link['source'] == nid and link['result'] != -1:
-                results_as_function.add(link['result'])
-        if len(results_as_function) == 1:
-            universal_nodes[nid] = list(results_as_function)[0]
-    
-    # Find "identity-like" behavior: A(X) -> X for all X
-    identity_like = []
-    for node in data['nodes']:
-        nid = node['id']
-        is_identity = True
-        for link in data['links']:
-            if link['source'] == nid:
-                if link['result'] != link['target']:
-                    is_identity = False
-                    break
-        if is_identity:
-            identity_like.append(nid)
-    
+
+    # Reactions that "leak" out of the network
+    leaks = [(int(s), int(t)) for s, t in zip(src[~closed], tgt[~closed])]
+
+    # Source -> distinct closed products as a CSR matrix: row s's products
+    # are producers.indices[indptr[s]:indptr[s+1]], two contiguous int
+    # arrays instead of a dict of Python sets
+    n = net.num_species
+    producers = csr_matrix(
+        (np.ones(closed_reactions, dtype=np.int8), (src[closed], res[closed])),
+        shape=(n, n))
+    producers.sum_duplicates()
+    producers.data[:] = 1
+
+    # "Universal" nodes produce the same result regardless of argument:
+    # exactly one distinct closed product, i.e. a single-entry CSR row
+    indptr = producers.indptr
+    universal_nodes = {int(s): int(producers.indices[indptr[s]])
+                       for s in np.flatnonzero(np.diff(indptr) == 1)}
+
+    # "Identity-like" behavior: A(X) -> X for every closed reaction of A
+    # (leaks and nodes with no reactions as function don't disqualify):
+    # one AND-reduction per source group over the arrays sorted by source
+    order = np.argsort(src, kind='stable')
+    ok = (res[order] == tgt[order]) | (res[order] == -1)
+    group_src, group_starts = np.unique(src[order], return_index=True)
+    non_identity: set[int] = set()
+    if len(group_starts):
+        group_ok = np.logical_and.reduceat(ok, group_starts)
+        non_identity = {int(s) for s, g in zip(group_src, group_ok) if not g}
+    identity_like = [nid for nid in net.ids if nid not in non_identity]
+
     return {
         'total_reactions': total_reactions,
         'closed_reactions': closed_reactions,
@@ -119,12 +253,115 @@ def analyze_network(data: dict[str, Any], labels: dict[int, str]) -> dict[str, A
     }
 
 
+def _fruchterman_reingold(G: nx.Graph) -> dict[int, tuple[float, float]]:
+    """Force-directed positions, preferring igraph's C layout when installed.
+
+    Both paths run Fruchterman-Reingold; 50 iterations is plenty for
+    networks under the visualization limit.
+    """
+    if ig is not None:
+        nodes = list(G.nodes())
+        index = {n: i for i, n in enumerate(nodes)}
+        g = ig.Graph(n=len(nodes),
+                     edges=[(index[u], index[v]) for u, v in G.edges()],
+                     directed=True)
+        layout = g.layout_fruchterman_reingold(niter=50)
+        return {n: tuple(layout[i]) for i, n in enumerate(nodes)}
+    return nx.spring_layout(G, k=2.5, iterations=50, seed=42)
+
+
+def _compute_positions(G: nx.DiGraph) -> dict[int, tuple[float, float]]:
+    """Compute node positions for drawing.
+
+    Dense networks run the force simulation only on the 2-core; peripheral
+    nodes are then hung off the mean position of their already-placed
+    neighbors with a little deterministic jitter, which reads the same but
+    keeps the expensive FR iterations on the small core.
+    """
+    if G.number_of_edges() > MAX_EDGES_FOR_FULL_LAYOUT:
+        undirected = G.to_undirected(as_view=True)
+        # k_core rejects self-loops, and self-reactions (A(A) -> C) are
+        # normal data here; core a loop-free copy while the graph actually
+        # drawn keeps its loops
+        loopless = nx.Graph(undirected)
+        loopless.remove_edges_from(nx.selfloop_edges(loopless))
+        core = nx.k_core(loopless, k=2)
+        if 0 < len(core) < len(G):
+            pos = _fruchterman_reingold(G.subgraph(core.nodes()))
+            rng = np.random.default_rng(42)
+            remaining = [n for n in G.nodes() if n not in pos]
+            while remaining:
+                # One pass places every node with an already-placed neighbor;
+                # chains hanging off the core resolve in a few passes.
+                placeable = [n for n in remaining
+                             if any(m in pos for m in undirected.neighbors(n))]
+                if not placeable:
+                    break
+                for n in placeable:
+                    anchors = [pos[m] for m in undirected.neighbors(n) if m in pos]
+                    cx, cy = np.mean(anchors, axis=0)
+                    dx, dy = rng.uniform(-0.08, 0.08, 2)
+                    pos[n] = (cx + dx, cy + dy)
+                remaining = [n for n in remaining if n not in pos]
+            # Anything with no path to the core gets scattered
+            for n in remaining:
+                dx, dy = rng.uniform(-1.0, 1.0, 2)
+                pos[n] = (dx, dy)
+            return pos
+    return _fruchterman_reingold(G)
+
+
+def compute_layout(G: nx.DiGraph) -> dict[int, tuple[float, float]]:
+    """Node positions for drawing, cached on disk per graph structure.
+
+    The cache key hashes the node and edge sets, so any structural change
+    recomputes while a byte-identical re-run loads the saved positions. A
+    broken or unwritable cache silently falls back to computing.
+    """
+    cache_path = None
+    try:
+        key = hashlib.blake2b(
+            json.dumps([sorted(G.nodes()), sorted(G.edges())],
+                       separators=(',', ':')).encode(),
+            digest_size=16).hexdigest()
+        cache_path = LAYOUT_CACHE_DIR / f"{key}.npz"
+        if cache_path.exists():
+            with np.load(cache_path) as cached:
+                return {int(n): (float(x), float(y))
+                        for n, (x, y) in zip(cached['nodes'], cached['xy'])}
+    except (OSError, ValueError, KeyError):
+        pass
+
+    pos = _compute_positions(G)
+
+    if cache_path is not None and pos:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            nodes = np.fromiter(pos, dtype=np.int64, count=len(pos))
+            xy = np.array(list(pos.values()), dtype=np.float64)
+            np.savez(cache_path, nodes=nodes, xy=xy)
+        except OSError:
+            pass
+    return pos
+
+
+@functools.lru_cache(maxsize=2048)
+def _split_label(label: str) -> list[str]:
+    return label.split('.')
+
+
+@functools.lru_cache(maxsize=2048)
 def shorten_label(label: str, max_len: int = 12) -> str:
-    """Shorten a lambda expression label for display."""
+    """Shorten a lambda expression label for display.
+
+    Labels come from the fixed node set and recur across the panel
+    sections with a handful of max_len values, so both the split and the
+    formatted result are memoized.
+    """
     if len(label) <= max_len:
         return label
     # Count the number of leading \vN. patterns
-    parts = label.split('.')
+    parts = _split_label(label)
     if len(parts) <= 2:
         return label[:max_len-2] + '..'
     # Show first param and depth indicator
@@ -132,15 +369,18 @@ def shorten_label(label: str, max_len: int = 12) -> str:
 
 
 def visualize_network(
-    data: dict[str, Any],
+    net: NetworkData,
     output_path: str | None = None,
-    show_all_edges: bool = False
+    show_all_edges: bool = False,
+    show: bool = True
 ) -> None:
     """Create a visualization of the reaction network."""
-    closed_graph, full_graph, labels, counts = build_reaction_graph(data)
-    analysis = analyze_network(data, labels)
-    
-    num_species = len(data['nodes'])
+    closed_graph, full_graph = build_reaction_graph(net)
+    analysis = analyze_network(net)
+    labels = net.labels
+    counts = net.counts
+
+    num_species = net.num_species
     too_large = num_species > MAX_SPECIES_FOR_VISUALIZATION
     
     if too_large:
@@ -169,19 +409,21 @@ def visualize_network(
     pos = {}
     
     if not too_large and len(G.nodes()) > 0:
-        pos = nx.spring_layout(G, k=2.5, iterations=100, seed=42)
+        pos = compute_layout(G)
     
     # Only draw network if not too large
     cmap = plt.cm.plasma  # Define cmap here for legend use
     
     if not too_large and ax1 is not None:
-        # Node sizes based on population count
-        max_count = max(counts.values()) if counts else 1
-        node_sizes = [300 + 1500 * (counts.get(n, 1) / max_count) for n in G.nodes()]
-        
-        # Node colors: gradient based on ID (shows evolutionary relationship)
+        # Node sizes based on population count, scaled in one array expression
+        counts_arr = np.array([counts.get(n, 1) for n in G.nodes()], dtype=np.float64)
+        node_sizes = 300 + 1500 * counts_arr / counts_arr.max()
+
+        # Node colors: gradient based on ID (shows evolutionary relationship).
+        # One vectorized colormap call returns the whole (N, 4) RGBA array
+        # instead of N Python-level cmap invocations.
         num_nodes = len(G.nodes())
-        node_colors = [cmap(i / max(num_nodes - 1, 1)) for i in range(num_nodes)]
+        node_colors = cmap(np.linspace(0.0, 1.0, max(num_nodes, 1)))
         
         # Draw edges
         edge_colors = []
@@ -195,16 +437,31 @@ def visualize_network(
                 edge_colors.append('#4a5568')  # Gray for closed
                 edge_styles.append('solid')
         
-        # Draw the network
-        nx.draw_networkx_edges(
-            G, pos, ax=ax1,
-            edge_color=edge_colors,
-            alpha=0.4,
-            arrows=True,
-            arrowsize=10,
-            connectionstyle="arc3,rad=0.1",
-            width=1.5
-        )
+        # Draw the network. Curved arrowheads only pay off while they are
+        # still distinguishable; past the threshold the batched straight-line
+        # path wins by orders of magnitude.
+        if G.number_of_edges() > MAX_EDGES_FOR_ARROWS:
+            edge_collection = nx.draw_networkx_edges(
+                G, pos, ax=ax1,
+                edge_color=edge_colors,
+                alpha=0.4,
+                arrows=False,
+                width=1.5
+            )
+            # Rasterize the dense edge layer at savefig time: the tangle
+            # becomes one image in the output instead of thousands of vector
+            # segments, while nodes and labels on top stay vector art
+            edge_collection.set_rasterized(True)
+        else:
+            nx.draw_networkx_edges(
+                G, pos, ax=ax1,
+                edge_color=edge_colors,
+                alpha=0.4,
+                arrows=True,
+                arrowsize=10,
+                connectionstyle="arc3,rad=0.1",
+                width=1.5
+            )
         
         nx.draw_networkx_nodes(
             G, pos, ax=ax1,
@@ -214,8 +471,14 @@ def visualize_network(
             linewidths=2
         )
         
-        # Labels: shortened versions
-        short_labels = {n: shorten_label(labels.get(n, str(n))) for n in G.nodes()}
+        # Labels: shortened versions. Past the threshold, labelling every
+        # node means one matplotlib Text artist each and an unreadable
+        # tangle, so only the five most abundant species get named.
+        if len(G) > MAX_NODES_FOR_LABELS:
+            label_nodes = sorted(G.nodes(), key=lambda n: -counts.get(n, 0))[:5]
+        else:
+            label_nodes = G.nodes()
+        short_labels = {n: shorten_label(labels.get(n, str(n))) for n in label_nodes}
         nx.draw_networkx_labels(
             G, pos, ax=ax1,
             labels=short_labels,
@@ -228,45 +491,47 @@ def visualize_network(
         ax1.axis('off')
     
     # ===== Analysis Panel =====
-    analysis_text = []
+    # Written into one string buffer instead of the grow-a-list-then-join
+    # idiom
+    buf = io.StringIO()
+    w = buf.write
+    total_pop = sum(counts.values())
     if too_large:
-        analysis_text.append("═══ NETWORK ANALYSIS (Summary Only) ═══\n")
-        analysis_text.append(f"⚠️  {num_species} species exceeds visualization limit ({MAX_SPECIES_FOR_VISUALIZATION})\n")
+        w(f"═══ NETWORK ANALYSIS (Summary Only) ═══\n\n"
+          f"⚠️  {num_species} species exceeds visualization limit ({MAX_SPECIES_FOR_VISUALIZATION})\n\n")
     else:
-        analysis_text.append("═══ NETWORK ANALYSIS ═══\n")
-    analysis_text.append(f"Species Count: {len(data['nodes'])}")
-    analysis_text.append(f"Total Population: {sum(counts.values())}")
-    analysis_text.append(f"Total Reactions: {analysis['total_reactions']}")
-    analysis_text.append(f"Closed Reactions: {analysis['closed_reactions']}")
-    analysis_text.append(f"Open (Leak) Reactions: {analysis['open_reactions']}")
-    analysis_text.append(f"Closure Ratio: {analysis['closure_ratio']:.1%}")
-    
-    analysis_text.append("\n═══ SPECIES (by abundance) ═══\n")
-    sorted_nodes = sorted(data['nodes'], key=lambda x: -x['count'])
-    for i, node in enumerate(sorted_nodes[:8]):  # Top 8
-        pct = 100 * node['count'] / sum(counts.values())
-        analysis_text.append(f"{i+1}. {shorten_label(node['label'], 20)}")
-        analysis_text.append(f"   Count: {node['count']} ({pct:.1f}%)")
-    
+        w("═══ NETWORK ANALYSIS ═══\n\n")
+    w(f"Species Count: {num_species}\n"
+      f"Total Population: {total_pop}\n"
+      f"Total Reactions: {analysis['total_reactions']}\n"
+      f"Closed Reactions: {analysis['closed_reactions']}\n"
+      f"Open (Leak) Reactions: {analysis['open_reactions']}\n"
+      f"Closure Ratio: {analysis['closure_ratio']:.1%}\n")
+
+    w("\n═══ SPECIES (by abundance) ═══\n\n")
+    sorted_nodes = sorted(net.ids, key=lambda nid: -counts[nid])
+    for i, nid in enumerate(sorted_nodes[:8]):  # Top 8
+        pct = 100 * counts[nid] / total_pop
+        w(f"{i+1}. {shorten_label(labels[nid], 20)}\n"
+          f"   Count: {counts[nid]} ({pct:.1f}%)\n")
+
     if len(sorted_nodes) > 8:
-        analysis_text.append(f"   ... and {len(sorted_nodes) - 8} more species")
-    
+        w(f"   ... and {len(sorted_nodes) - 8} more species\n")
+
     if analysis['universal_nodes']:
-        analysis_text.append("\n═══ CONSTANT FUNCTIONS ═══")
-        analysis_text.append("(Always produce same result)\n")
+        w("\n═══ CONSTANT FUNCTIONS ═══\n(Always produce same result)\n\n")
         for nid, result in list(analysis['universal_nodes'].items())[:5]:
-            analysis_text.append(f"  {shorten_label(labels[nid], 16)} → {shorten_label(labels[result], 12)}")
-    
+            w(f"  {shorten_label(labels[nid], 16)} → {shorten_label(labels[result], 12)}\n")
+
     if analysis['leaks']:
-        analysis_text.append("\n═══ LEAK REACTIONS ═══")
-        analysis_text.append("(Produce external results)\n")
+        w("\n═══ LEAK REACTIONS ═══\n(Produce external results)\n\n")
         for src, tgt in analysis['leaks'][:5]:
-            analysis_text.append(f"  {shorten_label(labels[src], 12)}({shorten_label(labels[tgt], 12)}) → ?")
+            w(f"  {shorten_label(labels[src], 12)}({shorten_label(labels[tgt], 12)}) → ?\n")
         if len(analysis['leaks']) > 5:
-            analysis_text.append(f"  ... and {len(analysis['leaks']) - 5} more")
-    
+            w(f"  ... and {len(analysis['leaks']) - 5} more\n")
+
     ax2.text(
-        0.05, 0.95, '\n'.join(analysis_text),
+        0.05, 0.95, buf.getvalue().rstrip('\n'),
         transform=ax2.transAxes,
         fontsize=10,
         fontfamily='monospace',
@@ -290,73 +555,69 @@ def visualize_network(
     if output_path:
         plt.savefig(output_path, dpi=150, facecolor='#0d1117', edgecolor='none')
         print(f"Saved visualization to {output_path}")
-    
-    plt.show()
 
+    if show:
+        plt.show()
+    plt.close(fig)
 
-def print_reaction_table(data: dict[str, Any]) -> None:
+
+def print_reaction_table(net: NetworkData) -> None:
     """Print a text-based reaction table for analysis."""
-    labels = {n['id']: n['label'] for n in data['nodes']}
-    n = len(data['nodes'])
-    
+    n = net.num_species
+
     print("\n═══ REACTION MATRIX ═══")
     print("(Row applies to Column → Result)")
     print()
-    
-    # Build matrix
-    matrix: dict[tuple[int, int], int] = {}
-    for link in data['links']:
-        matrix[(link['source'], link['target'])] = link['result']
-    
+
+    # The formatting loop reads dense matrix rows directly instead of doing
+    # N^2 dict lookups.
+    matrix = _reaction_matrix(net)
+
     # Header
     header = "     │ " + " ".join(f"{i:3}" for i in range(n))
     print(header)
     print("─" * len(header))
-    
+
     for i in range(n):
-        row = f"{i:3}  │ "
-        for j in range(n):
-            res = matrix.get((i, j), -1)
-            if res == -1:
-                row += "  X "
-            else:
-                row += f"{res:3} "
-        print(row)
-    
+        cells = "".join("  X " if r == -1 else f"{r:3} " for r in matrix[i])
+        print(f"{i:3}  │ {cells}")
+
     print()
     print("Legend: X = produces expression outside population")
 
 
 def main() -> None:
-    if len(sys.argv) < 2:
-        print("Usage: python visualize_network.py <network.json> [output.png]")
+    show = '--no-show' not in sys.argv
+    args = [a for a in sys.argv[1:] if a != '--no-show']
+
+    if not args:
+        print("Usage: python visualize_network.py <network.json> [output.png] [--no-show]")
         print("\nExample:")
         print("  python visualize_network.py 07.json network_viz.png")
         sys.exit(1)
-    
-    json_path = sys.argv[1]
-    output_path = sys.argv[2] if len(sys.argv) > 2 else None
+
+    json_path = args[0]
+    output_path = args[1] if len(args) > 1 else None
     
     if not Path(json_path).exists():
         print(f"Error: File not found: {json_path}")
         sys.exit(1)
     
     print(f"Loading network from {json_path}...")
-    data = load_network(json_path)
-    
-    num_species = len(data['nodes'])
-    num_reactions = len(data['links'])
-    print(f"Found {num_species} species and {num_reactions} reactions")
-    
+    net = load_network(json_path)
+
+    num_species = net.num_species
+    print(f"Found {num_species} species and {net.num_reactions} reactions")
+
     # Print reaction table (only for small networks)
     if num_species <= MAX_SPECIES_FOR_VISUALIZATION:
-        print_reaction_table(data)
+        print_reaction_table(net)
     else:
         print(f"\n⚠️  Skipping reaction table ({num_species} species is too large)")
         print(f"   Network visualization will show analysis summary only")
-    
+
     # Visualize
-    visualize_network(data, output_path)
+    visualize_network(net, output_path, show=show)
 
 
 if __name__ == "__main__":